@@ -4,18 +4,24 @@ from flask import Flask
 from .config import config_map
 from .extensions import db, migrate, socketio, cors
 from .errors import register_error_handlers
+from .json_provider import OrjsonProvider
 
 
-def create_app(env: str | None = None) -> Flask:
+def create_app(env: str | None = None, load_blueprints: bool = True) -> Flask:
     """Create and configure the Flask application.
 
     Args:
         env: Configuration environment name. Defaults to FLASK_ENV env var.
+        load_blueprints: When False, skip registering API blueprints and
+            socket handlers. CLI commands (e.g. flask db) and narrow unit
+            tests only need the extensions, so they can avoid importing the
+            whole route/handler chain on startup.
 
     Returns:
         Configured Flask application instance.
     """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
 
     # Load configuration
     env = env or os.environ.get("FLASK_ENV", "default")
@@ -26,10 +32,14 @@ def create_app(env: str | None = None) -> Flask:
     migrate.init_app(app, db)
     cors_origins = app.config["CORS_ORIGINS"]
     cors.init_app(app, resources={r"/*": {"origins": cors_origins}})
+    # Hand Socket.IO the same orjson codec the HTTP responses use, so
+    # broadcast packets skip the stdlib encoder too.
+    from . import json_provider
     socketio.init_app(
         app,
         cors_allowed_origins=cors_origins,
-        async_mode="eventlet",
+        async_mode=app.config["SOCKETIO_ASYNC_MODE"],
+        json=json_provider,
         logger=False,
         engineio_logger=False,
     )
@@ -38,18 +48,59 @@ def create_app(env: str | None = None) -> Flask:
     with app.app_context():
         from .models import game, player, card, round, submission, vote  # noqa: F401
 
-        # Auto-create tables if they don't exist (e.g. fresh SQLite volume)
+        # Resolve all relationships now so the first request doesn't pay the
+        # mapper-configuration cost.
+        from sqlalchemy.orm import configure_mappers
+        configure_mappers()
+
+        # Auto-create tables if they don't exist (e.g. fresh SQLite volume).
+        # This also pre-opens a pooled DB connection at startup.
         db.create_all()
 
-    # Register blueprints
-    from .api import register_blueprints
-    register_blueprints(app)
+    if app.debug:
+        _install_query_counter(app)
+
+    if load_blueprints:
+        # Register blueprints
+        from .api import register_blueprints
+        register_blueprints(app)
 
-    # Register socket handlers
-    from .sockets import register_handlers
-    register_handlers()
+        # Register socket handlers
+        from .sockets import register_handlers
+        register_handlers()
 
     # Register error handlers
     register_error_handlers(app)
 
     return app
+
+
+def _install_query_counter(app: Flask) -> None:
+    """Log the SQL statement count of every request in debug mode.
+
+    A cheap tripwire for N+1 regressions: the hot paths here are tuned to a
+    handful of statements each, so a payload build or route suddenly logging
+    dozens of queries is immediately visible in the dev console.
+
+    Args:
+        app: The configured Flask application.
+    """
+    from flask import g, request
+    from sqlalchemy import event
+
+    with app.app_context():
+        engine = db.engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count_statement(conn, cursor, statement, parameters, context, executemany):
+        try:
+            g._query_count = getattr(g, "_query_count", 0) + 1
+        except RuntimeError:
+            # No app context (e.g. engine used from a bare script) — skip.
+            pass
+
+    @app.teardown_request
+    def _log_query_count(exc) -> None:
+        count = g.pop("_query_count", 0)
+        if count:
+            app.logger.debug("%s %s: %d SQL statements", request.method, request.path, count)
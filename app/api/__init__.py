@@ -1,12 +1,37 @@
 """API blueprint registration."""
 from flask import Flask
+from werkzeug.routing import BaseConverter
+
+
+class GameCodeConverter(BaseConverter):
+    """URL converter for 6-character game codes.
+
+    Malformed codes are rejected in the routing layer (a plain 404) before
+    any handler or DB work runs, and handlers receive the canonical
+    uppercase form so they never need to re-normalise.
+    """
+
+    regex = "[A-Za-z0-9]{6}"
+
+    def to_python(self, value: str) -> str:
+        """Canonicalise the matched code to uppercase.
+
+        Args:
+            value: The raw path segment.
+
+        Returns:
+            The uppercase game code.
+        """
+        return value if value.isupper() else value.upper()
 
 
 def register_blueprints(app: Flask) -> None:
-    """Register all API blueprints on the app.
+    """Register URL converters and all API blueprints on the app.
 
     Args:
         app: The Flask application instance.
     """
+    app.url_map.converters["gcode"] = GameCodeConverter
+
     from .games import games_bp
     app.register_blueprint(games_bp, url_prefix="/api")
@@ -2,10 +2,52 @@
 from functools import wraps
 from typing import Callable, Any
 from flask import request, g
+from sqlalchemy import bindparam
 from ..extensions import db
 from ..models.player import Player
 from ..errors import UnauthorizedError
 
+# Built once at import so the ORM compile work isn't repeated per request.
+_SEL_PLAYER_BY_TOKEN = db.select(Player).where(Player.session_token == bindparam("token"))
+
+
+# Process-local token → player id cache. The token-indexed SELECT is the most
+# frequent query in the app (it runs on every authenticated request), and a
+# token never moves to a different player, so the mapping is a pure cache.
+# Hits are re-verified against the loaded row (which usually comes straight
+# from the session identity map), so deleted players and rotated tokens
+# self-heal without explicit invalidation. Single-instance only — same
+# caveat as the socket map in sockets/emitters.py.
+_token_to_player_id: dict[str, int] = {}
+_TOKEN_CACHE_MAX = 4096
+
+
+def _resolve_player(token: str) -> Player | None:
+    """Resolve a session token to a Player, using the process-local cache.
+
+    Args:
+        token: The session token to look up.
+
+    Returns:
+        The matching Player or None.
+    """
+    player_id = _token_to_player_id.get(token)
+    if player_id is not None:
+        player = db.session.get(Player, player_id)
+        if player is not None and player.session_token == token:
+            return player
+        # Stale entry (player deleted or token rotated on rejoin)
+        _token_to_player_id.pop(token, None)
+
+    player = db.session.execute(
+        _SEL_PLAYER_BY_TOKEN, {"token": token}
+    ).scalar_one_or_none()
+    if player is not None:
+        if len(_token_to_player_id) >= _TOKEN_CACHE_MAX:
+            _token_to_player_id.clear()
+        _token_to_player_id[token] = player.id
+    return player
+
 
 def require_auth(f: Callable) -> Callable:
     """Decorator that validates the X-Session-Token header and populates g.player.
@@ -19,9 +61,7 @@ def require_auth(f: Callable) -> Callable:
         token = request.headers.get("X-Session-Token")
         if not token:
             raise UnauthorizedError()
-        player = db.session.execute(
-            db.select(Player).where(Player.session_token == token)
-        ).scalar_one_or_none()
+        player = _resolve_player(token)
         if player is None:
             raise UnauthorizedError()
         g.player = player
@@ -39,6 +79,4 @@ def get_player_by_token(token: str) -> Player | None:
     Returns:
         The matching Player or None.
     """
-    return db.session.execute(
-        db.select(Player).where(Player.session_token == token)
-    ).scalar_one_or_none()
+    return _resolve_player(token)
@@ -1,20 +1,67 @@
 """All /api/games/* REST routes."""
-from flask import Blueprint, request, jsonify, g
+from flask import Blueprint, jsonify, g
+from sqlalchemy import bindparam
+from sqlalchemy.orm import selectinload
 from ..extensions import db
 from ..api.auth import require_auth
+from ..api.schemas import CardIdBody, CreateGameBody, JoinGameBody, SubmitCardsBody, parse_body
 from ..services import game_service, card_service, round_service, vote_service
-from ..services.state_service import build_game_state_payload, build_hand_payload
+from ..services.state_service import (
+    build_game_state_payload,
+    build_hand_payload,
+    bump_state_version,
+    forget_state,
+)
 from ..models.game import Game, GamePhase
 from ..models.round import Round, RoundPhase
-from ..errors import GameNotFoundError, PhaseMismatchError, ForbiddenError, ValidationError
-from ..sockets.emitters import emit_game_state, emit_hand_to_all, emit_hand_to_player, emit_player_removed
+from ..errors import GameNotFoundError, PhaseMismatchError, ForbiddenError
+from ..sockets.emitters import emit_game_state_async, emit_hand_to_all, emit_hand_to_player, emit_player_removed
 
 games_bp = Blueprint("games", __name__)
 
+# Process-local game code → id cache. A code never remaps to a different game
+# while its row exists, so entries only need dropping when the game is deleted
+# (finish_game). Same single-instance caveat as the token cache in auth.py.
+_code_to_game_id: dict[str, int] = {}
+_CODE_CACHE_MAX = 1024
+
+# Built once at import so the ORM compile work isn't repeated per request.
+_GAME_LOAD_OPTIONS = (selectinload(Game.players), selectinload(Game.current_round))
+_SEL_GAME_BY_ID = db.select(Game).options(*_GAME_LOAD_OPTIONS).where(Game.id == bindparam("game_id"))
+_SEL_GAME_BY_CODE = db.select(Game).options(*_GAME_LOAD_OPTIONS).where(Game.code == bindparam("code"))
+
+
+def _canonical_code(code: str) -> str:
+    """Normalise a game code to its stored (uppercase) form.
+
+    Codes are generated uppercase, so well-behaved clients send them back
+    unchanged — skip the fresh string allocation in that common case.
+
+    Args:
+        code: The raw code from the URL.
+
+    Returns:
+        The uppercase code.
+    """
+    return code if code.isupper() else code.upper()
+
+
+def _forget_game_code(code: str) -> None:
+    """Drop a deleted game's code from the process-local cache.
+
+    Args:
+        code: The (uppercase) game code to forget.
+    """
+    _code_to_game_id.pop(code, None)
+
 
 def _get_game(code: str) -> Game:
     """Fetch a game by code or raise 404.
 
+    Players and the current round are eager-loaded in the same round trip since
+    virtually every handler touches both. The loaded game is memoised on
+    ``flask.g`` so repeated lookups within one request are free.
+
     Args:
         code: The game code (case-insensitive).
 
@@ -24,11 +71,33 @@ def _get_game(code: str) -> Game:
     Raises:
         GameNotFoundError: If the game does not exist.
     """
-    game = db.session.execute(
-        db.select(Game).where(Game.code == code.upper())
-    ).scalar_one_or_none()
+    key = _canonical_code(code)
+    cache = getattr(g, "_game_cache", None)
+    if cache is None:
+        cache = g._game_cache = {}
+    if key in cache:
+        return cache[key]
+
+    game = None
+    game_id = _code_to_game_id.get(key)
+    if game_id is not None:
+        # Known code: fetch by primary key (cheapest lookup path); a stale
+        # entry simply misses and falls through to the by-code query.
+        game = db.session.execute(
+            _SEL_GAME_BY_ID, {"game_id": game_id}
+        ).scalar_one_or_none()
+        if game is None:
+            _forget_game_code(key)
     if game is None:
-        raise GameNotFoundError()
+        game = db.session.execute(
+            _SEL_GAME_BY_CODE, {"code": key}
+        ).scalar_one_or_none()
+        if game is None:
+            raise GameNotFoundError()
+        if len(_code_to_game_id) >= _CODE_CACHE_MAX:
+            _code_to_game_id.clear()
+        _code_to_game_id[key] = game.id
+    cache[key] = game
     return game
 
 
@@ -45,7 +114,12 @@ def _get_round(game: Game, round_id: int) -> Round:
     Raises:
         PhaseMismatchError: If the round does not belong to this game.
     """
-    round_obj = db.session.get(Round, round_id)
+    # Round actions nearly always target the current round, which _get_game
+    # eager-loads — no extra query then. db.session.get checks the identity
+    # map before hitting the DB for the rare historical-round case.
+    round_obj = game.current_round
+    if round_obj is None or round_obj.id != round_id:
+        round_obj = db.session.get(Round, round_id)
     if round_obj is None or round_obj.game_id != game.id:
         raise PhaseMismatchError("Round not found for this game.")
     return round_obj
@@ -58,18 +132,8 @@ def _get_round(game: Game, round_id: int) -> Round:
 @games_bp.route("/games", methods=["POST"])
 def create_game():
     """POST /api/games — create a new game session."""
-    data = request.get_json(force=True) or {}
-    display_name = (data.get("display_name") or "").strip()
-    role = data.get("role", "player")
-
-    if not display_name:
-        raise ValidationError("display_name is required.")
-    if len(display_name) > 50:
-        raise ValidationError("display_name must be 50 characters or fewer.")
-    if role not in ("player", "spectator"):
-        raise ValidationError("role must be 'player' or 'spectator'.")
-
-    result = game_service.create_game(display_name=display_name, role=role)
+    body = parse_body(CreateGameBody)
+    result = game_service.create_game(display_name=body.display_name, role=body.role)
     return jsonify(result), 201
 
 
@@ -77,22 +141,19 @@ def create_game():
 # Join game
 # ---------------------------------------------------------------------------
 
-@games_bp.route("/games/<code>/join", methods=["POST"])
+@games_bp.route("/games/<gcode:code>/join", methods=["POST"])
 def join_game(code: str):
     """POST /api/games/<code>/join — join an existing lobby game as a player."""
-    data = request.get_json(force=True) or {}
-    display_name = (data.get("display_name") or "").strip()
-
-    if not display_name:
-        raise ValidationError("display_name is required.")
-    if len(display_name) > 50:
-        raise ValidationError("display_name must be 50 characters or fewer.")
-
-    result = game_service.join_game(code=code, display_name=display_name)
+    # Resolve the game once through the per-request cache and hand it to the
+    # service — previously join_game ran its own by-code SELECT and the route
+    # fetched the game a second time for the broadcast.
+    game = _get_game(code)
+    body = parse_body(JoinGameBody)
+    result = game_service.join_game(game, display_name=body.display_name)
 
     # Broadcast updated game state so lobby shows new player
-    game = _get_game(code)
-    emit_game_state(game)
+    bump_state_version(game.id)
+    emit_game_state_async(game)
 
     return jsonify(result), 200
 
@@ -101,7 +162,7 @@ def join_game(code: str):
 # Get game state
 # ---------------------------------------------------------------------------
 
-@games_bp.route("/games/<code>", methods=["GET"])
+@games_bp.route("/games/<gcode:code>", methods=["GET"])
 @require_auth
 def get_game(code: str):
     """GET /api/games/<code> — full game state for the authenticated player."""
@@ -114,7 +175,7 @@ def get_game(code: str):
 # Reconnect
 # ---------------------------------------------------------------------------
 
-@games_bp.route("/games/<code>/reconnect", methods=["POST"])
+@games_bp.route("/games/<gcode:code>/reconnect", methods=["POST"])
 @require_auth
 def reconnect(code: str):
     """POST /api/games/<code>/reconnect — rehydrate client state after page refresh."""
@@ -127,19 +188,16 @@ def reconnect(code: str):
 # Submit cards
 # ---------------------------------------------------------------------------
 
-@games_bp.route("/games/<code>/cards", methods=["POST"])
+@games_bp.route("/games/<gcode:code>/cards", methods=["POST"])
 @require_auth
 def submit_cards(code: str):
     """POST /api/games/<code>/cards — player submits their 6 cards."""
     game = _get_game(code)
-    data = request.get_json(force=True) or {}
-    cards_data = data.get("cards", [])
-
-    if not isinstance(cards_data, list):
-        raise ValidationError("cards must be a list.")
+    body = parse_body(SubmitCardsBody)
 
-    card_service.save_player_cards(game, g.player, cards_data)
-    emit_game_state(game)
+    card_service.save_player_cards(game, g.player, body.cards)
+    bump_state_version(game.id)
+    emit_game_state_async(game)
     return jsonify({"submitted": True}), 201
 
 
@@ -147,7 +205,7 @@ def submit_cards(code: str):
 # Mark ready
 # ---------------------------------------------------------------------------
 
-@games_bp.route("/games/<code>/ready", methods=["POST"])
+@games_bp.route("/games/<gcode:code>/ready", methods=["POST"])
 @require_auth
 def mark_ready(code: str):
     """POST /api/games/<code>/ready — player marks themselves ready."""
@@ -158,21 +216,15 @@ def mark_ready(code: str):
     if g.player.is_spectator:
         raise ForbiddenError("Spectators do not mark ready.")
 
-    # Ensure player has submitted cards first
-    from ..models.card import Card
-    card_count = db.session.execute(
-        db.select(db.func.count()).select_from(Card).where(
-            Card.game_id == game.id,
-            Card.creator_id == g.player.id,
-        )
-    ).scalar() or 0
-
-    if card_count < 6:
+    # Ensure player has submitted cards first. A player only ever belongs to
+    # one game, so their created_cards collection is exactly this game's cards.
+    if len(g.player.created_cards) < 6:
         raise PhaseMismatchError("You must submit all 6 cards before marking ready.")
 
     g.player.is_ready = True
     db.session.commit()
-    emit_game_state(game)
+    bump_state_version(game.id)
+    emit_game_state_async(game)
     return jsonify({"ready": True}), 200
 
 
@@ -180,7 +232,7 @@ def mark_ready(code: str):
 # Remove a player (host-only, card_creation only)
 # ---------------------------------------------------------------------------
 
-@games_bp.route("/games/<code>/players/<int:player_id>", methods=["DELETE"])
+@games_bp.route("/games/<gcode:code>/players/<int:player_id>", methods=["DELETE"])
 @require_auth
 def remove_player(code: str, player_id: int):
     """DELETE /api/games/<code>/players/<id> — host removes a player during card creation."""
@@ -190,7 +242,8 @@ def remove_player(code: str, player_id: int):
     # Notify the kicked client first (their socket is still alive for one more event),
     # then broadcast the new roster to everyone else.
     emit_player_removed(game.code, snapshot["session_token"], snapshot["id"])
-    emit_game_state(game)
+    bump_state_version(game.id)
+    emit_game_state_async(game)
     return jsonify({"removed_player_id": snapshot["id"]}), 200
 
 
@@ -198,7 +251,7 @@ def remove_player(code: str, player_id: int):
 # Begin game (card_creation → playing)
 # ---------------------------------------------------------------------------
 
-@games_bp.route("/games/<code>/begin", methods=["POST"])
+@games_bp.route("/games/<gcode:code>/begin", methods=["POST"])
 @require_auth
 def begin_game(code: str):
     """POST /api/games/<code>/begin — creator begins the playing phase."""
@@ -211,43 +264,21 @@ def begin_game(code: str):
 
     # All non-spectator players must be connected at begin time. The host can
     # use the remove-player flow to evict anyone who isn't coming back; otherwise
-    # they wait for a rejoin. The connected-then-ready checks follow.
-    from ..models.player import Player, PlayerRole
-    disconnected_count = db.session.execute(
-        db.select(db.func.count()).select_from(Player).where(
-            Player.game_id == game.id,
-            Player.role == PlayerRole.PLAYER,
-            Player.is_connected.is_(False),
-        )
-    ).scalar() or 0
+    # they wait for a rejoin. The connected-then-ready checks follow. All three
+    # checks run over the players collection _get_game already loaded — no
+    # extra COUNT queries.
+    from ..models.player import PlayerRole
+    active = [p for p in game.players if p.role == PlayerRole.PLAYER]
 
-    if disconnected_count > 0:
+    if any(not p.is_connected for p in active):
         raise PhaseMismatchError(
             "Disconnected players — either remove them or wait for them to rejoin before starting."
         )
 
-    not_ready_connected = db.session.execute(
-        db.select(db.func.count()).select_from(Player).where(
-            Player.game_id == game.id,
-            Player.role == PlayerRole.PLAYER,
-            Player.is_connected.is_(True),
-            Player.is_ready.is_(False),
-        )
-    ).scalar() or 0
-
-    if not_ready_connected > 0:
+    if any(not p.is_ready for p in active):
         raise PhaseMismatchError("All connected players must be ready before the game can begin.")
 
-    ready_connected = db.session.execute(
-        db.select(db.func.count()).select_from(Player).where(
-            Player.game_id == game.id,
-            Player.role == PlayerRole.PLAYER,
-            Player.is_connected.is_(True),
-            Player.is_ready.is_(True),
-        )
-    ).scalar() or 0
-
-    if ready_connected < 2:
+    if len(active) < 2:
         raise PhaseMismatchError("At least 2 connected players are required to begin.")
 
     # Redistribute cards, transition phase, create first round — all in one transaction
@@ -257,8 +288,9 @@ def begin_game(code: str):
     first_round = round_service.create_first_round(game)
 
     # Emit private hands to each player, then broadcast state
+    bump_state_version(game.id)
     emit_hand_to_all(game)
-    emit_game_state(game)
+    emit_game_state_async(game)
 
     return jsonify({"phase": game.phase.value}), 200
 
@@ -267,28 +299,25 @@ def begin_game(code: str):
 # Submit card in a round
 # ---------------------------------------------------------------------------
 
-@games_bp.route("/games/<code>/rounds/<int:round_id>/submit", methods=["POST"])
+@games_bp.route("/games/<gcode:code>/rounds/<int:round_id>/submit", methods=["POST"])
 @require_auth
 def submit_card(code: str, round_id: int):
     """POST /api/games/<code>/rounds/<id>/submit — player submits a card for the round."""
     game = _get_game(code)
     round_obj = _get_round(game, round_id)
+    body = parse_body(CardIdBody)
 
-    data = request.get_json(force=True) or {}
-    card_id = data.get("card_id")
-    if card_id is None:
-        raise ValidationError("card_id is required.")
-
-    round_service.submit_card(game, round_obj, g.player, int(card_id))
+    # Record the submission and any resulting phase transition in one
+    # transaction — the emits happen once, after the single commit.
+    round_service.submit_card(game, round_obj, g.player, body.card_id, commit=False)
+    if round_service.check_all_submitted(game, round_obj):
+        round_service.begin_voting(round_obj, commit=False)
+    db.session.commit()
+    bump_state_version(game.id)
 
     # Send the updated hand (minus the played card) back to the submitting player
     emit_hand_to_player(g.player)
-
-    # Check if all players have now submitted → transition to voting
-    if round_service.check_all_submitted(game, round_obj):
-        round_service.begin_voting(round_obj)
-
-    emit_game_state(game)
+    emit_game_state_async(game)
     return jsonify({"submitted": True}), 200
 
 
@@ -296,24 +325,22 @@ def submit_card(code: str, round_id: int):
 # Vote in a round
 # ---------------------------------------------------------------------------
 
-@games_bp.route("/games/<code>/rounds/<int:round_id>/vote", methods=["POST"])
+@games_bp.route("/games/<gcode:code>/rounds/<int:round_id>/vote", methods=["POST"])
 @require_auth
 def vote(code: str, round_id: int):
     """POST /api/games/<code>/rounds/<id>/vote — cast a vote during the voting phase."""
     game = _get_game(code)
     round_obj = _get_round(game, round_id)
+    body = parse_body(CardIdBody)
 
-    data = request.get_json(force=True) or {}
-    card_id = data.get("card_id")
-    if card_id is None:
-        raise ValidationError("card_id is required.")
-
-    vote_service.record_vote(game, round_obj, g.player, int(card_id))
-
-    # Check if all connected players have voted → tally and complete round
+    # Record the vote and, if it was the last one, the tally — one transaction,
+    # one broadcast after the single commit.
+    vote_service.record_vote(game, round_obj, g.player, body.card_id, commit=False)
     if vote_service.all_voted(game, round_obj):
-        winning_card_ids, winner_player_ids = vote_service.tally_round(round_obj)
-        emit_game_state(game)
+        winning_card_ids, winner_player_ids = vote_service.tally_round(round_obj, commit=False)
+        db.session.commit()
+        bump_state_version(game.id)
+        emit_game_state_async(game)
         return jsonify({
             "voted": True,
             "round_complete": True,
@@ -321,7 +348,9 @@ def vote(code: str, round_id: int):
             "winner_player_ids": winner_player_ids,
         }), 200
 
-    emit_game_state(game)
+    db.session.commit()
+    bump_state_version(game.id)
+    emit_game_state_async(game)
     return jsonify({"voted": True, "round_complete": False}), 200
 
 
@@ -329,7 +358,7 @@ def vote(code: str, round_id: int):
 # Advance round (host only)
 # ---------------------------------------------------------------------------
 
-@games_bp.route("/games/<code>/rounds/<int:round_id>/advance", methods=["POST"])
+@games_bp.route("/games/<gcode:code>/rounds/<int:round_id>/advance", methods=["POST"])
 @require_auth
 def advance_round(code: str, round_id: int):
     """POST /api/games/<code>/rounds/<id>/advance — host advances to next round or finishes."""
@@ -338,7 +367,8 @@ def advance_round(code: str, round_id: int):
 
     next_round = round_service.advance_round(game, round_obj, g.player)
 
-    emit_game_state(game)
+    bump_state_version(game.id)
+    emit_game_state_async(game)
 
     if next_round is None:
         return jsonify({"game_finished": True}), 200
@@ -350,10 +380,14 @@ def advance_round(code: str, round_id: int):
 # Finish game (delete all data)
 # ---------------------------------------------------------------------------
 
-@games_bp.route("/games/<code>/finish", methods=["POST"])
+@games_bp.route("/games/<gcode:code>/finish", methods=["POST"])
 @require_auth
 def finish_game(code: str):
     """POST /api/games/<code>/finish — creator deletes the game and all its data."""
     game = _get_game(code)
+    game_code = game.code
+    game_id = game.id
     game_service.finish_game(game, g.player)
+    _forget_game_code(game_code)
+    forget_state(game_id)
     return jsonify({"deleted": True}), 200
@@ -0,0 +1,68 @@
+"""Request body schemas — validated once in pydantic-core instead of per-field Python checks."""
+from typing import Literal, TypeVar
+from flask import request
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic import ValidationError as PydanticValidationError
+from ..errors import ValidationError
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+class _Body(BaseModel):
+    """Base for request bodies: strips strings, ignores unknown fields."""
+
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
+
+
+class CreateGameBody(_Body):
+    """POST /api/games."""
+
+    display_name: str = Field(min_length=1, max_length=50)
+    role: Literal["player", "spectator"] = "player"
+
+
+class JoinGameBody(_Body):
+    """POST /api/games/<code>/join."""
+
+    display_name: str = Field(min_length=1, max_length=50)
+
+
+class SubmitCardsBody(_Body):
+    """POST /api/games/<code>/cards.
+
+    Per-card type/count rules stay in card_service, which owns those
+    error messages; the schema only guarantees the list-of-dicts shape.
+    """
+
+    cards: list[dict] = []
+
+
+class CardIdBody(_Body):
+    """POST round submit/vote bodies."""
+
+    card_id: int
+
+
+def parse_body(model: type[_ModelT]) -> _ModelT:
+    """Parse and validate the request body against a schema.
+
+    Reads the raw bytes and hands them straight to pydantic-core, skipping
+    Werkzeug's JSON layer entirely.
+
+    Args:
+        model: The schema class to validate against.
+
+    Returns:
+        The validated model instance.
+
+    Raises:
+        ValidationError: If the body is not valid JSON or fails the schema.
+    """
+    raw = request.get_data(cache=False)
+    try:
+        return model.model_validate_json(raw or b"{}")
+    except PydanticValidationError as exc:
+        first = exc.errors()[0]
+        loc = ".".join(str(part) for part in first["loc"])
+        message = f"{loc}: {first['msg']}" if loc else first["msg"]
+        raise ValidationError(message)
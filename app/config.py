@@ -9,7 +9,23 @@ class Config:
     DATABASE_URL: str = os.environ.get("DATABASE_URL", "sqlite:///game.db")
     SQLALCHEMY_DATABASE_URI: str = DATABASE_URL
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
+    # Roomy compiled-statement cache (the app re-runs a small set of queries
+    # at high frequency) plus a pool sized for concurrent socket traffic.
+    # Recycle ahead of Railway's idle-connection cutoff, and fail fast on
+    # checkout instead of queueing a socket handler for the default 30s.
+    SQLALCHEMY_ENGINE_OPTIONS: dict = {
+        "query_cache_size": 1200,
+        "pool_size": 20,
+        "max_overflow": 40,
+        "pool_pre_ping": True,
+        "pool_recycle": 300,
+        "pool_timeout": 10,
+    }
     CORS_ORIGINS: str = os.environ.get("CORS_ORIGINS", "*")
+    # Socket.IO async backend. "eventlet" matches the gunicorn worker class used
+    # in production; "threading" lets the app run under a plain WSGI/dev server
+    # without monkey-patching.
+    SOCKETIO_ASYNC_MODE: str = os.environ.get("SOCKETIO_ASYNC_MODE", "eventlet")
 
 
 class DevelopmentConfig(Config):
@@ -1,5 +1,6 @@
 """Custom exception classes and Flask error handlers."""
-from flask import jsonify
+import orjson
+from flask import Response, jsonify
 from typing import Any
 
 
@@ -76,25 +77,55 @@ class ValidationError(AppError):
         super().__init__("VALIDATION_ERROR", message, 400)
 
 
+def _static_body(code: str, message: str) -> bytes:
+    """Serialise an error body once at registration time.
+
+    Args:
+        code: Machine-readable error code.
+        message: Human-readable description.
+
+    Returns:
+        The JSON-encoded body bytes.
+    """
+    return orjson.dumps({"error": code, "message": message})
+
+
 def register_error_handlers(app: Any) -> None:
     """Register error handlers on the Flask app.
 
+    Errors with fixed messages (the no-arg classes above, plus the generic
+    HTTP handlers) serve pre-serialised bodies — these fire on every
+    unauthenticated poll or stale game code, so there's no reason to rebuild
+    the same JSON each time. Errors carrying dynamic messages fall back to
+    jsonify.
+
     Args:
         app: The Flask application instance.
     """
+    static_bodies: dict[str, bytes] = {}
+    for cls in (GameNotFoundError, DisplayNameTakenError, UnauthorizedError, AlreadySubmittedError):
+        err = cls()
+        static_bodies[err.code] = _static_body(err.code, err.message)
+
+    not_found_body = _static_body("NOT_FOUND", "The requested resource was not found.")
+    method_body = _static_body("METHOD_NOT_ALLOWED", "Method not allowed.")
+    internal_body = _static_body("INTERNAL_ERROR", "An internal server error occurred.")
 
     @app.errorhandler(AppError)
     def handle_app_error(err: AppError):
+        cached = static_bodies.get(err.code)
+        if cached is not None:
+            return Response(cached, status=err.status, mimetype="application/json")
         return jsonify({"error": err.code, "message": err.message}), err.status
 
     @app.errorhandler(404)
     def handle_404(err):
-        return jsonify({"error": "NOT_FOUND", "message": "The requested resource was not found."}), 404
+        return Response(not_found_body, status=404, mimetype="application/json")
 
     @app.errorhandler(405)
     def handle_405(err):
-        return jsonify({"error": "METHOD_NOT_ALLOWED", "message": "Method not allowed."}), 405
+        return Response(method_body, status=405, mimetype="application/json")
 
     @app.errorhandler(500)
     def handle_500(err):
-        return jsonify({"error": "INTERNAL_ERROR", "message": "An internal server error occurred."}), 500
+        return Response(internal_body, status=500, mimetype="application/json")
@@ -1,4 +1,7 @@
 """Shared Flask extension singletons."""
+import sqlite3
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_socketio import SocketIO
@@ -8,3 +11,23 @@ db = SQLAlchemy()
 migrate = Migrate()
 socketio = SocketIO()
 cors = CORS()
+
+
+@event.listens_for(Engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Tune SQLite connections as they are opened.
+
+    The default rollback-journal mode serialises every commit across all
+    games behind a full fsync. WAL lets readers proceed during writes and
+    synchronous=NORMAL drops the per-commit fsync while staying durable
+    enough for game state. Foreign keys are off by default in SQLite and
+    the schema relies on them. No-op for other dialects.
+    """
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
@@ -0,0 +1,64 @@
+"""orjson-backed JSON codec for Flask responses and Socket.IO packets."""
+from typing import Any
+import orjson
+from flask.json.provider import JSONProvider
+
+
+def dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialise obj to a JSON string with orjson.
+
+    Module-level so this module can be handed to SocketIO(json=...), which
+    expects a json-module-shaped object. Keyword arguments (separators etc.)
+    are accepted for compatibility and ignored — orjson always emits the
+    compact form.
+
+    Args:
+        obj: The object to serialise.
+
+    Returns:
+        The JSON string.
+    """
+    return orjson.dumps(obj).decode("utf-8")
+
+
+def loads(s: str | bytes, **kwargs: Any) -> Any:
+    """Deserialise a JSON string or bytes with orjson.
+
+    Args:
+        s: The JSON input.
+
+    Returns:
+        The parsed object.
+    """
+    return orjson.loads(s)
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that serialises with orjson instead of the stdlib.
+
+    State payloads are nested dicts of short strings and ints — exactly the
+    shape orjson is fastest at. jsonify() and response serialisation pick
+    this up automatically once installed on the app.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialise obj to a JSON string.
+
+        Args:
+            obj: The object to serialise.
+
+        Returns:
+            The JSON string.
+        """
+        return dumps(obj)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialise a JSON string or bytes.
+
+        Args:
+            s: The JSON input.
+
+        Returns:
+            The parsed object.
+        """
+        return loads(s)
@@ -1,8 +1,9 @@
 """Card model."""
 import enum
-from sqlalchemy import String, Boolean, Integer, Enum, ForeignKey
+from sqlalchemy import String, Boolean, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..extensions import db
+from .types import IntEnum
 
 
 class CardType(str, enum.Enum):
@@ -17,16 +18,26 @@ class Card(db.Model):
     """A single retrospective card created by a player."""
 
     __tablename__ = "cards"
+    __table_args__ = (
+        # Covers the per-player card count checked before marking ready
+        Index("ix_cards_game_creator", "game_id", "creator_id"),
+        # Covers hand loads and submit validation (holder_id = ? AND is_played = FALSE)
+        Index("ix_cards_holder_is_played", "holder_id", "is_played"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    game_id: Mapped[int] = mapped_column(Integer, ForeignKey("games.id"), nullable=False, index=True)
-    creator_id: Mapped[int] = mapped_column(Integer, ForeignKey("players.id"), nullable=False)
+    game_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("games.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    creator_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("players.id", ondelete="CASCADE"), nullable=False
+    )
     # holder_id is NULL once the card has been played in a round
     holder_id: Mapped[int | None] = mapped_column(
-        Integer, ForeignKey("players.id"), nullable=True, index=True
+        Integer, ForeignKey("players.id", ondelete="SET NULL"), nullable=True
     )
     card_type: Mapped[CardType] = mapped_column(
-        Enum(CardType, values_callable=lambda e: [v.value for v in e]),
+        IntEnum(CardType),
         nullable=False,
     )
     text: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -41,10 +52,10 @@ class Card(db.Model):
         "Player", foreign_keys=[holder_id], back_populates="held_cards"
     )
     submissions: Mapped[list["Submission"]] = relationship(  # type: ignore[name-defined]
-        "Submission", back_populates="card", lazy="select"
+        "Submission", back_populates="card", lazy="select", passive_deletes=True
     )
     votes: Mapped[list["Vote"]] = relationship(  # type: ignore[name-defined]
-        "Vote", back_populates="card", lazy="select"
+        "Vote", back_populates="card", lazy="select", passive_deletes=True
     )
 
     def __repr__(self) -> str:
@@ -1,9 +1,10 @@
 """Game model."""
 import enum
 from datetime import datetime
-from sqlalchemy import String, DateTime, Enum, ForeignKey, Integer
+from sqlalchemy import String, DateTime, ForeignKey, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..extensions import db
+from .types import IntEnum
 
 
 class GamePhase(str, enum.Enum):
@@ -23,22 +24,35 @@ class Game(db.Model):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     code: Mapped[str] = mapped_column(String(6), unique=True, nullable=False, index=True)
     phase: Mapped[GamePhase] = mapped_column(
-        Enum(GamePhase, values_callable=lambda e: [v.value for v in e]),
+        IntEnum(GamePhase),
         nullable=False,
         default=GamePhase.LOBBY,
     )
-    creator_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("players.id"), nullable=True)
+    creator_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("players.id", ondelete="SET NULL"), nullable=True
+    )
     current_round_id: Mapped[int | None] = mapped_column(
-        Integer, ForeignKey("rounds.id", use_alter=True, name="fk_game_current_round"), nullable=True
+        Integer,
+        ForeignKey(
+            "rounds.id", use_alter=True, name="fk_game_current_round", ondelete="SET NULL"
+        ),
+        nullable=True,
+    )
+    # Highest round_number created so far — saves the MAX(round_number) scan
+    # when the next round is built.
+    round_counter: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
     )
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     # Relationships
     players: Mapped[list["Player"]] = relationship(  # type: ignore[name-defined]
-        "Player", foreign_keys="Player.game_id", back_populates="game", lazy="select"
+        "Player", foreign_keys="Player.game_id", back_populates="game", lazy="select",
+        order_by="Player.join_order", passive_deletes=True
     )
     rounds: Mapped[list["Round"]] = relationship(  # type: ignore[name-defined]
-        "Round", foreign_keys="Round.game_id", back_populates="game", lazy="select"
+        "Round", foreign_keys="Round.game_id", back_populates="game", lazy="select",
+        passive_deletes=True
     )
     creator: Mapped["Player | None"] = relationship(  # type: ignore[name-defined]
         "Player", foreign_keys=[creator_id], lazy="select"
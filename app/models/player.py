@@ -1,9 +1,10 @@
 """Player model."""
 import enum
 from datetime import datetime
-from sqlalchemy import String, Boolean, Integer, DateTime, Enum, ForeignKey, UniqueConstraint
+from sqlalchemy import String, Boolean, Integer, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..extensions import db
+from .types import IntEnum
 
 
 class PlayerRole(str, enum.Enum):
@@ -17,13 +18,21 @@ class Player(db.Model):
     """Represents a participant (player or spectator) in a game session."""
 
     __tablename__ = "players"
-    __table_args__ = (UniqueConstraint("game_id", "display_name", name="uq_game_display_name"),)
+    __table_args__ = (
+        UniqueConstraint("game_id", "display_name", name="uq_game_display_name"),
+        # Covers the readiness checks run when the host begins the game
+        Index("ix_players_game_role_ready", "game_id", "role", "is_ready"),
+        # Covers the ordered roster query in round_service._eligible_players
+        Index("ix_players_game_role_order", "game_id", "role", "join_order"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    game_id: Mapped[int] = mapped_column(Integer, ForeignKey("games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("games.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     display_name: Mapped[str] = mapped_column(String(50), nullable=False)
     role: Mapped[PlayerRole] = mapped_column(
-        Enum(PlayerRole, values_callable=lambda e: [v.value for v in e]),
+        IntEnum(PlayerRole),
         nullable=False,
         default=PlayerRole.PLAYER,
     )
@@ -40,16 +49,18 @@ class Player(db.Model):
         "Game", foreign_keys=[game_id], back_populates="players"
     )
     created_cards: Mapped[list["Card"]] = relationship(  # type: ignore[name-defined]
-        "Card", foreign_keys="Card.creator_id", back_populates="creator", lazy="select"
+        "Card", foreign_keys="Card.creator_id", back_populates="creator", lazy="select",
+        passive_deletes=True
     )
     held_cards: Mapped[list["Card"]] = relationship(  # type: ignore[name-defined]
-        "Card", foreign_keys="Card.holder_id", back_populates="holder", lazy="select"
+        "Card", foreign_keys="Card.holder_id", back_populates="holder", lazy="select",
+        passive_deletes=True
     )
     submissions: Mapped[list["Submission"]] = relationship(  # type: ignore[name-defined]
-        "Submission", back_populates="player", lazy="select"
+        "Submission", back_populates="player", lazy="select", passive_deletes=True
     )
     votes: Mapped[list["Vote"]] = relationship(  # type: ignore[name-defined]
-        "Vote", back_populates="voter", lazy="select"
+        "Vote", back_populates="voter", lazy="select", passive_deletes=True
     )
 
     @property
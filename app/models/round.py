@@ -1,8 +1,9 @@
 """Round model."""
 import enum
-from sqlalchemy import String, Integer, Enum, ForeignKey
+from sqlalchemy import String, Integer, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..extensions import db
+from .types import IntEnum
 
 
 class RoundPhase(str, enum.Enum):
@@ -19,11 +20,13 @@ class Round(db.Model):
     __tablename__ = "rounds"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    game_id: Mapped[int] = mapped_column(Integer, ForeignKey("games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("games.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     round_number: Mapped[int] = mapped_column(Integer, nullable=False)
     adjective: Mapped[str] = mapped_column(String(100), nullable=False)
     phase: Mapped[RoundPhase] = mapped_column(
-        Enum(RoundPhase, values_callable=lambda e: [v.value for v in e]),
+        IntEnum(RoundPhase),
         nullable=False,
         default=RoundPhase.SUBMITTING,
     )
@@ -33,10 +36,10 @@ class Round(db.Model):
         "Game", foreign_keys=[game_id], back_populates="rounds"
     )
     submissions: Mapped[list["Submission"]] = relationship(  # type: ignore[name-defined]
-        "Submission", back_populates="round", lazy="select"
+        "Submission", back_populates="round", lazy="select", passive_deletes=True
     )
     votes: Mapped[list["Vote"]] = relationship(  # type: ignore[name-defined]
-        "Vote", back_populates="round", lazy="select"
+        "Vote", back_populates="round", lazy="select", passive_deletes=True
     )
 
     def __repr__(self) -> str:
@@ -1,6 +1,6 @@
 """Submission model."""
 from datetime import datetime
-from sqlalchemy import Integer, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Integer, DateTime, ForeignKey, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..extensions import db
 
@@ -12,10 +12,18 @@ class Submission(db.Model):
     __table_args__ = (UniqueConstraint("round_id", "player_id", name="uq_round_player_submission"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    round_id: Mapped[int] = mapped_column(Integer, ForeignKey("rounds.id"), nullable=False, index=True)
-    player_id: Mapped[int] = mapped_column(Integer, ForeignKey("players.id"), nullable=False)
-    card_id: Mapped[int] = mapped_column(Integer, ForeignKey("cards.id"), nullable=False)
-    submitted_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # No separate index on round_id — uq_round_player_submission leads with it.
+    round_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("rounds.id", ondelete="CASCADE"), nullable=False
+    )
+    player_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("players.id", ondelete="CASCADE"), nullable=False
+    )
+    card_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("cards.id", ondelete="CASCADE"), nullable=False
+    )
+    # DB-generated so bulk inserts don't carry a per-row Python timestamp
+    submitted_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
     round: Mapped["Round"] = relationship(  # type: ignore[name-defined]
@@ -0,0 +1,44 @@
+"""Custom column types shared by the models."""
+import enum
+from typing import Any
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class IntEnum(TypeDecorator):
+    """Stores a Python Enum as a SMALLINT instead of a VARCHAR.
+
+    The string form ("card_creation", "spectator", ...) only matters at the
+    API boundary; in the database a 2-byte int compares and indexes faster
+    and keeps rows smaller. Members map to 1-based ordinals in declaration
+    order, matching the enum-conversion migration — appending new members is
+    safe, reordering existing ones is not.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[enum.Enum], *args: Any, **kwargs: Any) -> None:
+        """Initialise the decorator for a concrete enum class.
+
+        Args:
+            enum_class: The Python Enum to map.
+        """
+        super().__init__(*args, **kwargs)
+        self._enum_class = enum_class
+        self._to_int = {member: i for i, member in enumerate(enum_class, start=1)}
+        self._from_int = {i: member for member, i in self._to_int.items()}
+
+    def process_bind_param(self, value: Any, dialect: Any) -> int | None:
+        """Convert an enum member (or its value) to its stored int."""
+        if value is None:
+            return None
+        if not isinstance(value, self._enum_class):
+            value = self._enum_class(value)
+        return self._to_int[value]
+
+    def process_result_value(self, value: int | None, dialect: Any) -> enum.Enum | None:
+        """Convert a stored int back to the enum member."""
+        if value is None:
+            return None
+        return self._from_int[value]
@@ -1,6 +1,6 @@
 """Vote model — used every round for all-player voting."""
 from datetime import datetime
-from sqlalchemy import Integer, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Integer, DateTime, ForeignKey, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..extensions import db
 
@@ -12,10 +12,18 @@ class Vote(db.Model):
     __table_args__ = (UniqueConstraint("round_id", "voter_id", name="uq_round_voter_vote"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    round_id: Mapped[int] = mapped_column(Integer, ForeignKey("rounds.id"), nullable=False, index=True)
-    voter_id: Mapped[int] = mapped_column(Integer, ForeignKey("players.id"), nullable=False)
-    card_id: Mapped[int] = mapped_column(Integer, ForeignKey("cards.id"), nullable=False)
-    voted_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # No separate index on round_id — uq_round_voter_vote leads with it.
+    round_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("rounds.id", ondelete="CASCADE"), nullable=False
+    )
+    voter_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("players.id", ondelete="CASCADE"), nullable=False
+    )
+    card_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("cards.id", ondelete="CASCADE"), nullable=False
+    )
+    # DB-generated so bulk inserts don't carry a per-row Python timestamp
+    voted_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
     round: Mapped["Round"] = relationship(  # type: ignore[name-defined]
@@ -1,12 +1,21 @@
 """Card service — submission, validation, and redistribution."""
 import random
+from collections import defaultdict
 from typing import Any, List
+from sqlalchemy import bindparam
 from ..extensions import db
 from ..models.card import Card, CardType
 from ..models.player import Player, PlayerRole
 from ..models.game import Game, GamePhase
 from ..errors import PhaseMismatchError, ValidationError, ForbiddenError
 
+# Built once at import so the per-call cost is parameter binding only —
+# same pattern as the prepared statements in app/api/games.py.
+_SEL_HAND = db.select(Card).where(
+    Card.holder_id == bindparam("player_id"),
+    Card.is_played.is_(False),
+)
+
 
 def save_player_cards(game: Game, player: Player, cards_data: List[dict]) -> None:
     """Save 6 cards for a player during the card_creation phase.
@@ -45,17 +54,21 @@ def save_player_cards(game: Game, player: Player, cards_data: List[dict]) -> Non
         db.delete(Card).where(Card.game_id == game.id, Card.creator_id == player.id)
     )
 
-    for c in cards_data:
-        card = Card(
-            game_id=game.id,
-            creator_id=player.id,
-            holder_id=player.id,  # Initially held by the creator
-            card_type=CardType(c["card_type"]),
-            text=c["text"].strip(),
-            is_played=False,
-        )
-        db.session.add(card)
-
+    # One multi-row INSERT instead of six single-row INSERTs at flush.
+    db.session.execute(
+        db.insert(Card),
+        [
+            {
+                "game_id": game.id,
+                "creator_id": player.id,
+                "holder_id": player.id,  # Initially held by the creator
+                "card_type": CardType(c["card_type"]),
+                "text": c["text"].strip(),
+                "is_played": False,
+            }
+            for c in cards_data
+        ],
+    )
     db.session.commit()
 
 
@@ -76,23 +89,28 @@ def redistribute_cards(game: Game) -> None:
     player_ids = [p.id for p in players]
     n = len(player_ids)
 
+    # One SELECT for the whole deck, grouped by type in Python — the per-type
+    # split doesn't need three separate index probes.
+    buckets: dict[CardType, list[Card]] = defaultdict(list)
+    for card in db.session.execute(
+        db.select(Card).where(Card.game_id == game.id)
+    ).scalars():
+        buckets[card.card_type].append(card)
+
+    # Collect the full redistribution plan, then apply it as one executemany
+    # UPDATE keyed by primary key instead of a per-card UPDATE at flush.
+    assignments: list[dict[str, Any]] = []
     for card_type in CardType:
-        cards = db.session.execute(
-            db.select(Card).where(
-                Card.game_id == game.id,
-                Card.card_type == card_type,
-            )
-        ).scalars().all()
-
-        card_list = list(cards)
+        card_list = buckets[card_type]
         random.shuffle(card_list)
 
         for i, player_id in enumerate(player_ids):
             chunk = card_list[i * 2 : i * 2 + 2]
             for card in chunk:
-                card.holder_id = player_id
-                card.is_played = False
+                assignments.append({"id": card.id, "holder_id": player_id, "is_played": False})
 
+    if assignments:
+        db.session.execute(db.update(Card), assignments)
     db.session.commit()
 
 
@@ -106,10 +124,7 @@ def get_player_hand(player: Player) -> List[dict[str, Any]]:
         List of card dicts including text (private).
     """
     cards = db.session.execute(
-        db.select(Card).where(
-            Card.holder_id == player.id,
-            Card.is_played.is_(False),
-        )
+        _SEL_HAND, {"player_id": player.id}
     ).scalars().all()
 
     return [
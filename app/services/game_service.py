@@ -1,12 +1,12 @@
 """Game lifecycle service — creation, joining, starting, and finishing games."""
 from typing import Any
+from sqlalchemy.exc import IntegrityError
 from ..extensions import db
 from ..models.game import Game, GamePhase
 from ..models.player import Player, PlayerRole
 from ..utils.code_generator import generate_game_code
 from ..utils.token_generator import generate_session_token
 from ..errors import (
-    GameNotFoundError,
     DisplayNameTakenError,
     PhaseMismatchError,
     ForbiddenError,
@@ -23,22 +23,21 @@ def create_game(display_name: str, role: str) -> dict[str, Any]:
     Returns:
         Dict with game_code, session_token, player_id, and player data.
     """
-    # Generate a unique game code
+    # Insert optimistically and let the UNIQUE constraint on Game.code catch
+    # collisions — codes almost never collide, so the happy path is a single
+    # INSERT with no verification SELECT. Games start directly in
+    # CARD_CREATION — no separate lobby step. Late joiners can still hop in
+    # while card_creation is open.
     for _ in range(10):
-        code = generate_game_code()
-        existing = db.session.execute(
-            db.select(Game).where(Game.code == code)
-        ).scalar_one_or_none()
-        if existing is None:
+        game = Game(code=generate_game_code(), phase=GamePhase.CARD_CREATION)
+        db.session.add(game)
+        try:
+            db.session.flush()  # Get game.id without committing
             break
+        except IntegrityError:
+            db.session.rollback()
     else:
-        code = generate_game_code()  # Accept small collision risk after 10 attempts
-
-    # Games start directly in CARD_CREATION — no separate lobby step. Late joiners
-    # can still hop in while card_creation is open.
-    game = Game(code=code, phase=GamePhase.CARD_CREATION)
-    db.session.add(game)
-    db.session.flush()  # Get game.id without committing
+        raise RuntimeError("Could not allocate a unique game code after 10 attempts.")
 
     player_role = PlayerRole.SPECTATOR if role == "spectator" else PlayerRole.PLAYER
     token = generate_session_token()
@@ -66,7 +65,7 @@ def create_game(display_name: str, role: str) -> dict[str, Any]:
     }
 
 
-def join_game(code: str, display_name: str) -> dict[str, Any]:
+def join_game(game: Game, display_name: str) -> dict[str, Any]:
     """Join an existing game as a new player, or rejoin a disconnected slot.
 
     Brand-new players may join while the game is in LOBBY (legacy) or
@@ -74,19 +73,16 @@ def join_game(code: str, display_name: str) -> dict[str, Any]:
     rejoin-by-name path is available for a disconnected player to come back.
 
     Args:
-        code: The game code to join.
+        game: The Game instance (resolved by the route's cached lookup).
         display_name: Desired display name.
 
     Returns:
         Dict with session_token, player_id, and player data.
 
     Raises:
-        GameNotFoundError: If no game with that code exists.
         PhaseMismatchError: If the game has started and no reconnect match exists.
         DisplayNameTakenError: If the name is taken by a connected player.
     """
-    game = _get_game_or_404(code)
-
     # Check if a player with this name already exists in the game (case-insensitive)
     existing_player = db.session.execute(
         db.select(Player).where(
@@ -133,7 +129,13 @@ def join_game(code: str, display_name: str) -> dict[str, Any]:
         is_connected=True,
     )
     db.session.add(player)
-    db.session.commit()
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Two clients joined with the same name at once and both passed the
+        # SELECT above — uq_game_display_name decides the loser.
+        db.session.rollback()
+        raise DisplayNameTakenError()
 
     return {
         "session_token": token,
@@ -207,32 +209,10 @@ def finish_game(game: Game, requesting_player: Player) -> None:
     """
     _assert_creator(game, requesting_player)
 
-    from ..models.vote import Vote
-    from ..models.submission import Submission
-    from ..models.card import Card
-    from ..models.round import Round
-
-    game_id = game.id
-    round_ids = [
-        r.id for r in db.session.execute(
-            db.select(Round).where(Round.game_id == game_id)
-        ).scalars().all()
-    ]
-
-    if round_ids:
-        db.session.execute(db.delete(Vote).where(Vote.round_id.in_(round_ids)))
-        db.session.execute(db.delete(Submission).where(Submission.round_id.in_(round_ids)))
-
-    db.session.execute(db.delete(Round).where(Round.game_id == game_id))
-    db.session.execute(db.delete(Card).where(Card.game_id == game_id))
-
-    # Decouple foreign keys before deleting
-    game.creator_id = None
-    game.current_round_id = None
-    db.session.flush()
-
-    db.session.execute(db.delete(Player).where(Player.game_id == game_id))
-    db.session.delete(game)
+    # All child FKs carry ondelete="CASCADE" (see migration d7b2e48a915c), so
+    # one DELETE on the game row tears down players, rounds, cards,
+    # submissions, and votes in a single statement.
+    db.session.execute(db.delete(Game).where(Game.id == game.id))
     db.session.commit()
 
 
@@ -247,32 +227,14 @@ def get_game_state_for_player(game: Game, requesting_player: Player) -> dict[str
         Dict combining the public game state and the player's private cards.
     """
     from .state_service import build_game_state_payload, build_hand_payload
-    state = build_game_state_payload(game)
+    # Shallow-copy before enriching: the payload may be the shared cached
+    # dict, and my_cards must never leak into a room-wide broadcast.
+    state = dict(build_game_state_payload(game))
     hand = build_hand_payload(requesting_player)
     state["my_cards"] = hand["cards"]
     return state
 
 
-def _get_game_or_404(code: str) -> Game:
-    """Fetch game by code or raise GameNotFoundError.
-
-    Args:
-        code: The game code to look up.
-
-    Returns:
-        The matching Game instance.
-
-    Raises:
-        GameNotFoundError: If not found.
-    """
-    game = db.session.execute(
-        db.select(Game).where(Game.code == code.upper())
-    ).scalar_one_or_none()
-    if game is None:
-        raise GameNotFoundError()
-    return game
-
-
 def _assert_creator(game: Game, player: Player) -> None:
     """Raise ForbiddenError if player is not the game creator.
 
@@ -1,5 +1,7 @@
 """Round service — creation, submission handling, and phase transitions."""
 from typing import Any
+from sqlalchemy import bindparam
+from sqlalchemy.exc import IntegrityError
 from ..extensions import db
 from ..models.game import Game, GamePhase
 from ..models.player import Player, PlayerRole
@@ -17,6 +19,23 @@ from ..errors import (
 # The game always lasts exactly 6 rounds.
 MAX_ROUNDS = 6
 
+# Built once at import so the per-call cost is parameter binding only —
+# same pattern as the prepared statements in app/api/games.py.
+_SEL_PENDING_SUBMITTERS = (
+    db.select(db.func.count())
+    .select_from(Player)
+    .where(
+        Player.game_id == bindparam("game_id"),
+        Player.is_connected.is_(True),
+        Player.role == PlayerRole.PLAYER,
+        Player.id.notin_(
+            db.select(Submission.player_id)
+            .where(Submission.round_id == bindparam("round_id"))
+            .scalar_subquery()
+        ),
+    )
+)
+
 
 def create_first_round(game: Game) -> Round:
     """Create the first round of a game after begin is clicked.
@@ -27,7 +46,7 @@ def create_first_round(game: Game) -> Round:
     Returns:
         The newly created Round instance.
     """
-    return _create_round(game, round_number=1)
+    return _create_round(game)
 
 
 def create_next_round(game: Game) -> Round:
@@ -39,22 +58,25 @@ def create_next_round(game: Game) -> Round:
     Returns:
         The newly created Round instance.
     """
-    last_round_number = db.session.execute(
-        db.select(db.func.max(Round.round_number)).where(Round.game_id == game.id)
-    ).scalar() or 0
-    return _create_round(game, round_number=last_round_number + 1)
+    return _create_round(game)
 
 
-def _create_round(game: Game, round_number: int) -> Round:
+def _create_round(game: Game) -> Round:
     """Internal helper to build and persist a new Round row.
 
+    The round number comes from Game.round_counter instead of a
+    MAX(round_number) scan over the rounds table. Round creation only ever
+    runs behind the begin/advance guards, so a plain ORM increment is
+    race-safe here.
+
     Args:
         game: The Game instance.
-        round_number: The 1-indexed round number.
 
     Returns:
         The saved Round instance.
     """
+    round_number = game.round_counter + 1
+    game.round_counter = round_number
     new_round = Round(
         game_id=game.id,
         round_number=round_number,
@@ -68,32 +90,43 @@ def _create_round(game: Game, round_number: int) -> Round:
     # On the final round every player has exactly 1 card left — auto-submit it
     # and skip straight to voting. Only auto-submit for connected players.
     if round_number >= MAX_ROUNDS:
-        players = _eligible_players(game)
-        for player in players:
-            if not player.is_connected:
-                continue
-            card = db.session.execute(
+        player_ids = [p.id for p in _eligible_players(game) if p.is_connected]
+        cards = []
+        if player_ids:
+            cards = db.session.execute(
                 db.select(Card).where(
-                    Card.holder_id == player.id,
-                    Card.is_played.is_(False),
                     Card.game_id == game.id,
+                    Card.is_played.is_(False),
+                    Card.holder_id.in_(player_ids),
                 )
-            ).scalar_one_or_none()
-            if card is not None:
-                card.is_played = True
-                card.holder_id = None
-                db.session.add(Submission(
-                    round_id=new_round.id,
-                    player_id=player.id,
-                    card_id=card.id,
-                ))
+            ).scalars().all()
+        submission_rows = [
+            {
+                "round_id": new_round.id,
+                "player_id": card.holder_id,
+                "card_id": card.id,
+            }
+            for card in cards
+        ]
+        if submission_rows:
+            db.session.execute(db.insert(Submission), submission_rows)
+            # One statement flips every auto-submitted card; the commit below
+            # expires the loaded Card objects, so no session sync is needed.
+            db.session.execute(
+                db.update(Card)
+                .where(Card.id.in_([row["card_id"] for row in submission_rows]))
+                .values(is_played=True, holder_id=None)
+                .execution_options(synchronize_session=False)
+            )
         new_round.phase = RoundPhase.VOTING
 
     db.session.commit()
     return new_round
 
 
-def submit_card(game: Game, round_obj: Round, player: Player, card_id: int) -> Submission:
+def submit_card(
+    game: Game, round_obj: Round, player: Player, card_id: int, commit: bool = True
+) -> Submission:
     """Record a player's card submission for the current round.
 
     All non-spectator players submit one card per round.
@@ -103,6 +136,8 @@ def submit_card(game: Game, round_obj: Round, player: Player, card_id: int) -> S
         round_obj: The current Round.
         player: The submitting player.
         card_id: ID of the card to submit.
+        commit: When False, flush instead of committing so the caller can
+            fold follow-up mutations into the same transaction.
 
     Returns:
         The created Submission instance.
@@ -118,32 +153,47 @@ def submit_card(game: Game, round_obj: Round, player: Player, card_id: int) -> S
     if player.is_spectator:
         raise ForbiddenError("Spectators cannot submit cards.")
 
-    # Check for duplicate submission
-    existing = db.session.execute(
-        db.select(Submission).where(
-            Submission.round_id == round_obj.id,
-            Submission.player_id == player.id,
-        )
-    ).scalar_one_or_none()
-    if existing is not None:
-        raise AlreadySubmittedError()
-
     # Validate card ownership and playability
     card = db.session.get(Card, card_id)
     if card is None or card.holder_id != player.id or card.is_played or card.game_id != game.id:
+        # A retried submit fails validation too (the card is already played),
+        # so check for this player's existing submission before deciding which
+        # error applies — a duplicate must surface as AlreadySubmittedError.
+        already_submitted = db.session.execute(
+            db.select(
+                db.exists().where(
+                    Submission.round_id == round_obj.id,
+                    Submission.player_id == player.id,
+                )
+            )
+        ).scalar()
+        if already_submitted:
+            raise AlreadySubmittedError()
         raise InvalidCardError("Card is invalid, not in your hand, or already played.")
 
-    # Mark card as played
-    card.is_played = True
-    card.holder_id = None
-
+    # Insert optimistically and let uq_round_player_submission catch
+    # duplicates — atomic under concurrent submits, and the happy path skips
+    # the pre-check SELECT entirely.
     submission = Submission(
         round_id=round_obj.id,
         player_id=player.id,
         card_id=card_id,
     )
     db.session.add(submission)
-    db.session.commit()
+    try:
+        db.session.flush()
+    except IntegrityError:
+        db.session.rollback()
+        raise AlreadySubmittedError()
+
+    # Mark card as played
+    card.is_played = True
+    card.holder_id = None
+
+    if commit:
+        db.session.commit()
+    else:
+        db.session.flush()
 
     return submission
 
@@ -164,31 +214,22 @@ def check_all_submitted(game: Game, round_obj: Round) -> bool:
     Returns:
         True iff no connected non-spectator player is still pending submission.
     """
-    from ..models.player import PlayerRole
-    submitted_player_ids = (
-        db.select(Submission.player_id)
-        .where(Submission.round_id == round_obj.id)
-        .scalar_subquery()
-    )
     pending_count = db.session.execute(
-        db.select(db.func.count()).select_from(Player).where(
-            Player.game_id == game.id,
-            Player.is_connected.is_(True),
-            Player.role == PlayerRole.PLAYER,
-            Player.id.notin_(submitted_player_ids),
-        )
+        _SEL_PENDING_SUBMITTERS, {"game_id": game.id, "round_id": round_obj.id}
     ).scalar() or 0
     return pending_count == 0
 
 
-def begin_voting(round_obj: Round) -> None:
+def begin_voting(round_obj: Round, commit: bool = True) -> None:
     """Transition a round from submitting to voting phase.
 
     Args:
         round_obj: The Round to transition.
+        commit: When False, leave the commit to the caller's transaction.
     """
     round_obj.phase = RoundPhase.VOTING
-    db.session.commit()
+    if commit:
+        db.session.commit()
 
 
 def advance_round(game: Game, round_obj: Round, requesting_player: Player) -> Round | None:
@@ -233,13 +274,18 @@ def advance_round(game: Game, round_obj: Round, requesting_player: Player) -> Ro
 def _eligible_players(game: Game) -> list[Player]:
     """Return non-spectator players sorted by join_order.
 
+    Queried directly (covered by ix_players_game_role_order) rather than
+    filtered out of game.players, so spectators never get loaded and the
+    ordering comes from the index instead of a Python sort.
+
     Args:
         game: The Game instance.
 
     Returns:
         Sorted list of eligible Player instances.
     """
-    return sorted(
-        [p for p in game.players if not p.is_spectator],
-        key=lambda p: p.join_order,
-    )
+    return db.session.execute(
+        db.select(Player)
+        .where(Player.game_id == game.id, Player.role == PlayerRole.PLAYER)
+        .order_by(Player.join_order)
+    ).scalars().all()
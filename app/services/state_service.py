@@ -6,10 +6,74 @@ to preserve anonymity.
 """
 from typing import Any
 from ..extensions import db
-from ..models.game import Game
+from ..models.game import Game, GamePhase
 from ..models.round import RoundPhase
+from ..models.card import Card
+from ..models.submission import Submission
+from ..models.vote import Vote
 from ..services.round_service import MAX_ROUNDS
 
+# Process-local payload cache keyed by game id, valid for one state version.
+# Every mutating route/handler bumps the version after its commit; a cached
+# entry is served only while its tag equals the current version, so rapid
+# successive broadcasts of unchanged state (several sockets reconnecting,
+# coalesced submits) reuse the built dict instead of re-running the queries.
+#
+# Filling is restricted to cache_game_state, whose callers capture the
+# version BEFORE loading the game: if a commit lands mid-build, its bump makes
+# the entry's tag stale the moment it is stored, so mixed reads are never
+# served. Same single-instance caveat as the caches in app/api/auth.py.
+_state_versions: dict[int, int] = {}
+_payload_cache: dict[int, tuple[int, dict[str, Any]]] = {}
+_STATE_CACHE_MAX = 1024
+
+
+def bump_state_version(game_id: int) -> None:
+    """Invalidate the cached payload for a game after a state mutation.
+
+    Args:
+        game_id: The game whose broadcast state changed.
+    """
+    _state_versions[game_id] = _state_versions.get(game_id, 0) + 1
+
+
+def current_state_version(game_id: int) -> int:
+    """Return the game's current state version.
+
+    Callers that intend to cache a payload must read this before loading any
+    game data, so a concurrent mutation invalidates what they build.
+
+    Args:
+        game_id: The game's id.
+
+    Returns:
+        The version counter (0 if never bumped).
+    """
+    return _state_versions.get(game_id, 0)
+
+
+def cache_game_state(game_id: int, version: int, payload: dict[str, Any]) -> None:
+    """Store a built payload under the version captured before it was built.
+
+    Args:
+        game_id: The game's id.
+        version: Value of current_state_version from before the game load.
+        payload: The payload returned by build_game_state_payload.
+    """
+    if len(_payload_cache) >= _STATE_CACHE_MAX:
+        _payload_cache.clear()
+    _payload_cache[game_id] = (version, payload)
+
+
+def forget_state(game_id: int) -> None:
+    """Drop a deleted game's version counter and cached payload.
+
+    Args:
+        game_id: The deleted game's id.
+    """
+    _state_versions.pop(game_id, None)
+    _payload_cache.pop(game_id, None)
+
 
 def build_game_state_payload(game: Game) -> dict[str, Any]:
     """Build the full game state dict for a room-wide broadcast.
@@ -25,17 +89,29 @@ def build_game_state_payload(game: Game) -> dict[str, Any]:
     Returns:
         A dict representing the full game state.
     """
-    from ..models.card import Card
+    cached = _payload_cache.get(game.id)
+    if cached is not None and cached[0] == _state_versions.get(game.id, 0):
+        return cached[1]
+
+    # One grouped count for every holder at once instead of a COUNT per
+    # player. In the lobby nobody holds cards yet, so skip the query and
+    # report zeros.
+    held_counts: dict[int, int] = {}
+    if game.phase != GamePhase.LOBBY:
+        held_counts = dict(
+            db.session.execute(
+                db.select(Card.holder_id, db.func.count())
+                .where(
+                    Card.game_id == game.id,
+                    Card.is_played.is_(False),
+                    Card.holder_id.is_not(None),
+                )
+                .group_by(Card.holder_id)
+            ).all()
+        )
 
     players_data = []
-    for p in sorted(game.players, key=lambda x: x.join_order):
-        held_count = db.session.execute(
-            db.select(db.func.count()).select_from(Card).where(
-                Card.holder_id == p.id,
-                Card.is_played.is_(False),
-            )
-        ).scalar() or 0
-
+    for p in game.players:  # relationship is ordered by join_order
         players_data.append({
             "id": p.id,
             "display_name": p.display_name,
@@ -44,15 +120,17 @@ def build_game_state_payload(game: Game) -> dict[str, Any]:
             "score": p.score,
             "is_connected": p.is_connected,
             "is_ready": p.is_ready,
-            "card_count": held_count,
+            "card_count": held_counts.get(p.id, 0),
         })
 
     current_round_data = None
     if game.current_round is not None:
         r = game.current_round
-        submission_status = _build_submission_status(game, r)
+        # One spectator-filter pass shared by both status builders.
+        eligible = [p for p in game.players if not p.is_spectator]
+        submission_status = _build_submission_status(eligible, r)
         revealed = _build_revealed_submissions(r) if r.phase != RoundPhase.SUBMITTING else None
-        vote_status = _build_vote_status(game, r) if r.phase == RoundPhase.VOTING else None
+        vote_status = _build_vote_status(eligible, r) if r.phase == RoundPhase.VOTING else None
         winning_card_ids, winner_player_ids = (
             _compute_winners(r) if r.phase == RoundPhase.COMPLETE else ([], [])
         )
@@ -82,70 +160,62 @@ def build_game_state_payload(game: Game) -> dict[str, Any]:
     }
 
 
-def _build_submission_status(game: Game, round_obj) -> list[dict[str, Any]]:
+def _build_submission_status(eligible_players, round_obj) -> list[dict[str, Any]]:
     """Build submission status list — who has submitted vs pending.
 
     All non-spectator players appear in this list.
 
     Args:
-        game: The Game instance.
+        eligible_players: Non-spectator players in join order.
         round_obj: The current Round instance.
 
     Returns:
         List of dicts with player_id, display_name, and has_submitted.
     """
-    from ..models.submission import Submission
-
-    submitted_player_ids = {
-        s.player_id
-        for s in db.session.execute(
-            db.select(Submission).where(Submission.round_id == round_obj.id)
-        ).scalars().all()
-    }
+    # Only the ids are needed — select the column and skip ORM hydration.
+    submitted_player_ids = set(
+        db.session.execute(
+            db.select(Submission.player_id).where(Submission.round_id == round_obj.id)
+        ).scalars()
+    )
 
-    result = []
-    for p in sorted(game.players, key=lambda x: x.join_order):
-        if p.is_spectator:
-            continue
-        result.append({
+    return [
+        {
             "player_id": p.id,
             "display_name": p.display_name,
             "has_submitted": p.id in submitted_player_ids,
-        })
-    return result
+        }
+        for p in eligible_players
+    ]
 
 
-def _build_vote_status(game: Game, round_obj) -> list[dict[str, Any]]:
+def _build_vote_status(eligible_players, round_obj) -> list[dict[str, Any]]:
     """Build vote status list — who has voted vs pending.
 
     Only non-spectator players are listed (spectators cannot vote).
 
     Args:
-        game: The Game instance.
+        eligible_players: Non-spectator players in join order.
         round_obj: The current Round instance.
 
     Returns:
         List of dicts with player_id, display_name, and has_voted.
     """
-    from ..models.vote import Vote
-
-    voted_player_ids = {
-        v.voter_id
-        for v in db.session.execute(
-            db.select(Vote).where(Vote.round_id == round_obj.id)
-        ).scalars().all()
-    }
+    # Only the ids are needed — select the column and skip ORM hydration.
+    voted_player_ids = set(
+        db.session.execute(
+            db.select(Vote.voter_id).where(Vote.round_id == round_obj.id)
+        ).scalars()
+    )
 
-    result = []
-    for p in sorted(game.players, key=lambda x: x.join_order):
-        if p.is_spectator:
-            continue
-        result.append({
+    return [
+        {
             "player_id": p.id,
             "display_name": p.display_name,
             "has_voted": p.id in voted_player_ids,
-        })
-    return result
+        }
+        for p in eligible_players
+    ]
 
 
 def _build_revealed_submissions(round_obj) -> list[dict[str, Any]]:
@@ -159,20 +229,21 @@ def _build_revealed_submissions(round_obj) -> list[dict[str, Any]]:
     Returns:
         List of dicts with submission_id, card_id, card_type, and card_text only.
     """
-    from ..models.submission import Submission
-
-    submissions = db.session.execute(
-        db.select(Submission).where(Submission.round_id == round_obj.id)
-    ).scalars().all()
+    # One joined column-tuple query — no ORM objects, no relationship loads.
+    rows = db.session.execute(
+        db.select(Submission.id, Submission.card_id, Card.card_type, Card.text)
+        .join(Card, Submission.card_id == Card.id)
+        .where(Submission.round_id == round_obj.id)
+    ).all()
 
     return [
         {
-            "submission_id": s.id,
-            "card_id": s.card_id,
-            "card_type": s.card.card_type.value,
-            "card_text": s.card.text,
+            "submission_id": submission_id,
+            "card_id": card_id,
+            "card_type": card_type.value,
+            "card_text": card_text,
         }
-        for s in submissions
+        for submission_id, card_id, card_type, card_text in rows
     ]
 
 
@@ -185,31 +256,27 @@ def _compute_winners(round_obj) -> tuple[list[int], list[int]]:
     Returns:
         Tuple of (winning_card_ids, winner_player_ids).
     """
-    from ..models.vote import Vote
-    from ..models.submission import Submission
-
-    votes = db.session.execute(
-        db.select(Vote).where(Vote.round_id == round_obj.id)
-    ).scalars().all()
-
-    if not votes:
+    # One round-trip: join the GROUP BY vote tally back onto the round's
+    # submissions, then pick the max-count rows in Python. Every voted card
+    # is a submission of this round, so the join loses nothing.
+    tally_subq = (
+        db.select(Vote.card_id, db.func.count().label("cnt"))
+        .where(Vote.round_id == round_obj.id)
+        .group_by(Vote.card_id)
+        .subquery()
+    )
+    rows = db.session.execute(
+        db.select(Submission.card_id, Submission.player_id, tally_subq.c.cnt)
+        .join(tally_subq, Submission.card_id == tally_subq.c.card_id)
+        .where(Submission.round_id == round_obj.id)
+    ).all()
+
+    if not rows:
         return [], []
 
-    vote_counts: dict[int, int] = {}
-    for v in votes:
-        vote_counts[v.card_id] = vote_counts.get(v.card_id, 0) + 1
-
-    max_votes = max(vote_counts.values())
-    winning_card_ids = [cid for cid, cnt in vote_counts.items() if cnt == max_votes]
-
-    winning_submissions = db.session.execute(
-        db.select(Submission).where(
-            Submission.round_id == round_obj.id,
-            Submission.card_id.in_(winning_card_ids),
-        )
-    ).scalars().all()
-
-    winner_player_ids = [sub.player_id for sub in winning_submissions]
+    max_votes = max(cnt for _, _, cnt in rows)
+    winning_card_ids = [cid for cid, _, cnt in rows if cnt == max_votes]
+    winner_player_ids = [pid for _, pid, cnt in rows if cnt == max_votes]
 
     return winning_card_ids, winner_player_ids
 
@@ -225,7 +292,6 @@ def build_hand_payload(player) -> dict[str, Any]:
     Returns:
         Dict with type and cards list including card text.
     """
-    from ..models.card import Card
     cards = db.session.execute(
         db.select(Card).where(
             Card.holder_id == player.id,
@@ -1,5 +1,7 @@
 """Vote service — per-round voting and tallying."""
 from typing import Any
+from sqlalchemy import bindparam
+from sqlalchemy.exc import IntegrityError
 from ..extensions import db
 from ..models.game import Game
 from ..models.player import Player, PlayerRole
@@ -8,8 +10,27 @@ from ..models.submission import Submission
 from ..models.vote import Vote
 from ..errors import PhaseMismatchError, ForbiddenError, AlreadySubmittedError, InvalidCardError
 
+# Built once at import so the per-call cost is parameter binding only —
+# same pattern as the prepared statements in app/api/games.py.
+_SEL_PENDING_VOTERS = (
+    db.select(db.func.count())
+    .select_from(Player)
+    .where(
+        Player.game_id == bindparam("game_id"),
+        Player.is_connected.is_(True),
+        Player.role == PlayerRole.PLAYER,
+        Player.id.notin_(
+            db.select(Vote.voter_id)
+            .where(Vote.round_id == bindparam("round_id"))
+            .scalar_subquery()
+        ),
+    )
+)
+
 
-def record_vote(game: Game, round_obj: Round, voter: Player, card_id: int) -> None:
+def record_vote(
+    game: Game, round_obj: Round, voter: Player, card_id: int, commit: bool = True
+) -> None:
     """Record a vote during the voting phase of any round.
 
     Only non-spectator players may vote, exactly once per round.
@@ -19,6 +40,8 @@ def record_vote(game: Game, round_obj: Round, voter: Player, card_id: int) -> No
         round_obj: The current Round (must be in voting phase).
         voter: The player casting the vote.
         card_id: The card being voted for.
+        commit: When False, flush instead of committing so the caller can
+            fold the tally into the same transaction.
 
     Raises:
         PhaseMismatchError: If the round is not in voting phase.
@@ -31,32 +54,52 @@ def record_vote(game: Game, round_obj: Round, voter: Player, card_id: int) -> No
     if voter.is_spectator:
         raise ForbiddenError("Spectators cannot vote.")
 
-    existing = db.session.execute(
-        db.select(Vote).where(
-            Vote.round_id == round_obj.id,
-            Vote.voter_id == voter.id,
+    # Validation and insert in one statement: the row only lands if the card
+    # was submitted this round AND the voter hasn't voted yet, so the happy
+    # path is a single round-trip with no TOCTOU window. rowcount == 0 means
+    # one of the guards failed; only then is a follow-up probe needed to pick
+    # the right error.
+    try:
+        result = db.session.execute(
+            db.insert(Vote).from_select(
+                ["round_id", "voter_id", "card_id"],
+                db.select(
+                    db.literal(round_obj.id),
+                    db.literal(voter.id),
+                    db.literal(card_id),
+                ).where(
+                    db.exists().where(
+                        Submission.round_id == round_obj.id,
+                        Submission.card_id == card_id,
+                    ),
+                    ~db.exists().where(
+                        Vote.round_id == round_obj.id,
+                        Vote.voter_id == voter.id,
+                    ),
+                ),
+            )
         )
-    ).scalar_one_or_none()
-    if existing is not None:
+    except IntegrityError:
+        # Two simultaneous votes from the same player can both pass the
+        # NOT EXISTS guard — uq_round_voter decides the loser.
+        db.session.rollback()
         raise AlreadySubmittedError()
 
-    # Verify the card was submitted in this round
-    submission = db.session.execute(
-        db.select(Submission).where(
-            Submission.round_id == round_obj.id,
-            Submission.card_id == card_id,
-        )
-    ).scalar_one_or_none()
-    if submission is None:
+    if result.rowcount == 0:
+        already_voted = db.session.execute(
+            db.select(
+                db.exists().where(
+                    Vote.round_id == round_obj.id,
+                    Vote.voter_id == voter.id,
+                )
+            )
+        ).scalar()
+        if already_voted:
+            raise AlreadySubmittedError()
         raise InvalidCardError("That card was not submitted in this round.")
 
-    vote = Vote(
-        round_id=round_obj.id,
-        voter_id=voter.id,
-        card_id=card_id,
-    )
-    db.session.add(vote)
-    db.session.commit()
+    if commit:
+        db.session.commit()
 
 
 def all_voted(game: Game, round_obj: Round) -> bool:
@@ -73,64 +116,71 @@ def all_voted(game: Game, round_obj: Round) -> bool:
     Returns:
         True iff no connected non-spectator player is still pending a vote.
     """
-    voted_player_ids = (
-        db.select(Vote.voter_id)
-        .where(Vote.round_id == round_obj.id)
-        .scalar_subquery()
-    )
     pending_count = db.session.execute(
-        db.select(db.func.count()).select_from(Player).where(
-            Player.game_id == game.id,
-            Player.is_connected.is_(True),
-            Player.role == PlayerRole.PLAYER,
-            Player.id.notin_(voted_player_ids),
-        )
+        _SEL_PENDING_VOTERS, {"game_id": game.id, "round_id": round_obj.id}
     ).scalar() or 0
     return pending_count == 0
 
 
-def tally_round(round_obj: Round) -> tuple[list[int], list[int]]:
+def tally_round(round_obj: Round, commit: bool = True) -> tuple[list[int], list[int]]:
     """Tally votes, award points to winners, and mark the round complete.
 
     All tied winners receive a point (regardless of how many are tied).
 
     Args:
         round_obj: The current Round.
+        commit: When False, leave the commit to the caller's transaction.
 
     Returns:
-        Tuple of (winning_card_ids, winner_player_ids).
+        Tuple of (winning_card_ids, winner_player_ids). Empty lists if the
+        round was already tallied by a concurrent caller.
     """
-    votes = db.session.execute(
-        db.select(Vote).where(Vote.round_id == round_obj.id)
-    ).scalars().all()
+    # tally_round is reachable from both the vote route and the disconnect
+    # re-check; lock the round row (no-op on SQLite, FOR UPDATE elsewhere)
+    # and bail if a concurrent caller already completed it, so winners can
+    # never be awarded the same point twice.
+    locked = db.session.execute(
+        db.select(Round).where(Round.id == round_obj.id).with_for_update()
+    ).scalar_one()
+    if locked.phase == RoundPhase.COMPLETE:
+        return [], []
+
+    # Tally in the database — (card_id, count) tuples instead of shipping
+    # every vote row over the wire and accumulating in Python.
+    tallies = db.session.execute(
+        db.select(Vote.card_id, db.func.count())
+        .where(Vote.round_id == round_obj.id)
+        .group_by(Vote.card_id)
+    ).all()
 
     winning_card_ids: list[int] = []
     winner_player_ids: list[int] = []
 
-    if votes:
-        # Tally votes per card
-        vote_counts: dict[int, int] = {}
-        for v in votes:
-            vote_counts[v.card_id] = vote_counts.get(v.card_id, 0) + 1
-
-        max_votes = max(vote_counts.values())
-        winning_card_ids = [cid for cid, cnt in vote_counts.items() if cnt == max_votes]
-
-        # Award a point to each player who submitted a winning card
-        winning_submissions = db.session.execute(
-            db.select(Submission).where(
-                Submission.round_id == round_obj.id,
-                Submission.card_id.in_(winning_card_ids),
-            )
-        ).scalars().all()
+    if tallies:
+        max_votes = max(cnt for _, cnt in tallies)
+        winning_card_ids = [cid for cid, cnt in tallies if cnt == max_votes]
 
-        for sub in winning_submissions:
-            winner = db.session.get(Player, sub.player_id)
-            if winner:
-                winner.score += 1
-                winner_player_ids.append(winner.id)
+        # Award a point to each player who submitted a winning card — one
+        # UPDATE driven by the submissions subquery, with RETURNING handing
+        # back the winner ids, so the separate winner-submissions SELECT is
+        # gone. The commit expires any Player objects in the session, so no
+        # session sync is needed.
+        winner_subq = db.select(Submission.player_id).where(
+            Submission.round_id == round_obj.id,
+            Submission.card_id.in_(winning_card_ids),
+        )
+        winner_player_ids = list(
+            db.session.execute(
+                db.update(Player)
+                .where(Player.id.in_(winner_subq))
+                .values(score=Player.score + 1)
+                .returning(Player.id)
+                .execution_options(synchronize_session=False)
+            ).scalars()
+        )
 
     round_obj.phase = RoundPhase.COMPLETE
-    db.session.commit()
+    if commit:
+        db.session.commit()
 
     return winning_card_ids, winner_player_ids
@@ -1,13 +1,89 @@
 """Socket.IO emitter helpers — the only place that calls socketio.emit()."""
+from collections import defaultdict
+from threading import Lock
 from typing import Any
+from flask import current_app
+from sqlalchemy.orm import selectinload
 from ..extensions import db, socketio
+from ..models.card import Card
 from ..models.game import Game
 from ..models.player import Player
 
 
-# In-memory mapping of session_token → socket_id for targeted hand delivery.
-# Acceptable for single-instance Railway deployment. Refreshed on each join_game_room event.
-_token_to_sid: dict[str, str] = {}
+class SessionSocketMap:
+    """Bidirectional session_token ↔ socket id map with striped locking.
+
+    Both directions are sharded by key hash, each shard guarded by its own
+    lock, so concurrent joins/disconnects only contend when they land on the
+    same shard. Locks are never nested — cross-direction updates take the
+    two shard locks in sequence, and each removal re-checks that the entry
+    still points at the value it expects, so a reconnect that re-registered
+    the token in between is left untouched. Still process-local: acceptable
+    for single-instance Railway deployment.
+    """
+
+    _N_SHARDS = 16
+
+    def __init__(self) -> None:
+        self._token_locks = [Lock() for _ in range(self._N_SHARDS)]
+        self._token_shards: list[dict[str, str]] = [{} for _ in range(self._N_SHARDS)]
+        self._sid_locks = [Lock() for _ in range(self._N_SHARDS)]
+        self._sid_shards: list[dict[str, str]] = [{} for _ in range(self._N_SHARDS)]
+
+    def _shard(self, key: str) -> int:
+        return hash(key) & (self._N_SHARDS - 1)
+
+    def register(self, session_token: str, sid: str) -> None:
+        """Point the token at a new sid, dropping any stale reverse entry."""
+        i = self._shard(session_token)
+        with self._token_locks[i]:
+            old_sid = self._token_shards[i].get(session_token)
+            self._token_shards[i][session_token] = sid
+        # A reconnect gives the token a new sid — drop the old socket's
+        # reverse entry so its late disconnect can't unregister the new one.
+        if old_sid is not None and old_sid != sid:
+            j = self._shard(old_sid)
+            with self._sid_locks[j]:
+                if self._sid_shards[j].get(old_sid) == session_token:
+                    del self._sid_shards[j][old_sid]
+        j = self._shard(sid)
+        with self._sid_locks[j]:
+            self._sid_shards[j][sid] = session_token
+
+    def unregister_sid(self, sid: str) -> str | None:
+        """Remove a mapping by sid; returns the token it belonged to, if any."""
+        j = self._shard(sid)
+        with self._sid_locks[j]:
+            token = self._sid_shards[j].pop(sid, None)
+        if token is not None:
+            i = self._shard(token)
+            with self._token_locks[i]:
+                if self._token_shards[i].get(token) == sid:
+                    del self._token_shards[i][token]
+        return token
+
+    def pop_token(self, session_token: str) -> str | None:
+        """Remove a mapping by token; returns the sid it pointed at, if any."""
+        i = self._shard(session_token)
+        with self._token_locks[i]:
+            sid = self._token_shards[i].pop(session_token, None)
+        if sid is not None:
+            j = self._shard(sid)
+            with self._sid_locks[j]:
+                if self._sid_shards[j].get(sid) == session_token:
+                    del self._sid_shards[j][sid]
+        return sid
+
+    def get_sid(self, session_token: str) -> str | None:
+        """Return the sid currently registered for a token, if any."""
+        i = self._shard(session_token)
+        with self._token_locks[i]:
+            return self._token_shards[i].get(session_token)
+
+
+# In-memory token ↔ sid index for targeted hand delivery. Refreshed on each
+# join_game_room event.
+_sessions = SessionSocketMap()
 
 
 def register_socket(session_token: str, sid: str) -> None:
@@ -17,7 +93,7 @@ def register_socket(session_token: str, sid: str) -> None:
         session_token: The player's session token.
         sid: The Socket.IO session ID.
     """
-    _token_to_sid[session_token] = sid
+    _sessions.register(session_token, sid)
 
 
 def unregister_socket(sid: str) -> str | None:
@@ -29,11 +105,36 @@ def unregister_socket(sid: str) -> str | None:
     Returns:
         The session token that was removed, or None.
     """
-    for token, socket_id in list(_token_to_sid.items()):
-        if socket_id == sid:
-            del _token_to_sid[token]
-            return token
-    return None
+    return _sessions.unregister_sid(sid)
+
+
+# Above this many clients in a room, state broadcasts are sent in slices
+# with a scheduler yield between them so one huge room (e.g. a big
+# spectator crowd) can't starve other greenlets for the whole send.
+_BROADCAST_BATCH_SIZE = 50
+
+
+def _emit_state_to_room(payload: dict[str, Any], room: str) -> None:
+    """Send a game_state_updated payload to a room, chunking large rooms.
+
+    Rooms at or under the batch size (the overwhelmingly common case) take
+    the ordinary single room emit.
+
+    Args:
+        payload: The built state payload.
+        room: The game code / room name.
+    """
+    try:
+        sids = [sid for sid, _ in socketio.server.manager.get_participants("/", room)]
+    except KeyError:
+        sids = []
+    if len(sids) <= _BROADCAST_BATCH_SIZE:
+        socketio.emit("game_state_updated", payload, room=room)
+        return
+    for i in range(0, len(sids), _BROADCAST_BATCH_SIZE):
+        for sid in sids[i:i + _BROADCAST_BATCH_SIZE]:
+            socketio.emit("game_state_updated", payload, to=sid)
+        socketio.sleep(0)
 
 
 def emit_game_state(game: Game) -> None:
@@ -44,7 +145,66 @@ def emit_game_state(game: Game) -> None:
     """
     from ..services.state_service import build_game_state_payload
     payload = build_game_state_payload(game)
-    socketio.emit("game_state_updated", payload, room=game.code)
+    _emit_state_to_room(payload, game.code)
+
+
+# Games with a broadcast already scheduled. Concurrent actions in the same
+# game (e.g. every player submitting within one tick) each request a
+# broadcast, but one snapshot of the latest committed state serves them all —
+# the debounce window lets those requests collapse into a single emit.
+_pending_broadcasts: set[int] = set()
+_BROADCAST_DEBOUNCE_SECONDS = 0.02
+
+
+def emit_game_state_async(game: Game) -> None:
+    """Schedule the game-state broadcast on a background task.
+
+    Building the state payload costs several queries plus serialisation that
+    only the *other* clients in the room need — the requesting client gets its
+    answer in the HTTP response. Scheduling the broadcast lets the route
+    return right after its commit. The game is re-loaded by id inside a fresh
+    app context because the request's session is gone by the time the task
+    runs; a game deleted in between simply skips the emit. Requests arriving
+    while a broadcast is already pending are coalesced into it.
+
+    Args:
+        game: The Game instance (must be committed — only its id is captured).
+    """
+    app = current_app._get_current_object()
+    game_id = game.id
+    if game_id in _pending_broadcasts:
+        return
+    _pending_broadcasts.add(game_id)
+
+    def _broadcast() -> None:
+        from ..services.state_service import (
+            build_game_state_payload,
+            cache_game_state,
+            current_state_version,
+        )
+
+        socketio.sleep(_BROADCAST_DEBOUNCE_SECONDS)
+        # Clear the flag before reading so a mutation landing after the load
+        # schedules a fresh broadcast rather than being lost.
+        _pending_broadcasts.discard(game_id)
+        with app.app_context():
+            # Version must be captured before the load — a commit landing
+            # mid-build then leaves the cached entry already-stale instead of
+            # poisoning the cache with mixed reads.
+            version = current_state_version(game_id)
+            # The state payload iterates the roster and reads the current
+            # round, so load both up front rather than lazily mid-build.
+            loaded = db.session.get(
+                Game,
+                game_id,
+                options=[selectinload(Game.players), selectinload(Game.current_round)],
+            )
+            if loaded is not None:
+                payload = build_game_state_payload(loaded)
+                cache_game_state(game_id, version, payload)
+                _emit_state_to_room(payload, loaded.code)
+
+    socketio.start_background_task(_broadcast)
 
 
 def emit_hand_to_player(player: Player) -> None:
@@ -54,7 +214,7 @@ def emit_hand_to_player(player: Player) -> None:
         player: The Player instance whose hand to emit.
     """
     from ..services.state_service import build_hand_payload
-    sid = _token_to_sid.get(player.session_token)
+    sid = _sessions.get_sid(player.session_token)
     if sid:
         payload = build_hand_payload(player)
         socketio.emit("your_cards_updated", payload, to=sid)
@@ -66,9 +226,27 @@ def emit_hand_to_all(game: Game) -> None:
     Args:
         game: The Game instance.
     """
+    # One query fetches every live hand in the game; bucketing by holder
+    # replaces the per-player SELECT that build_hand_payload would issue.
+    # Payload shape matches build_hand_payload exactly.
+    rows = db.session.execute(
+        db.select(Card.holder_id, Card.id, Card.card_type, Card.text).where(
+            Card.game_id == game.id,
+            Card.is_played.is_(False),
+            Card.holder_id.is_not(None),
+        )
+    ).all()
+    hands: dict[int, list[dict[str, Any]]] = defaultdict(list)
+    for holder_id, card_id, card_type, text in rows:
+        hands[holder_id].append({"id": card_id, "card_type": card_type.value, "text": text})
+
     for player in game.players:
-        if not player.is_spectator:
-            emit_hand_to_player(player)
+        if player.is_spectator:
+            continue
+        sid = _sessions.get_sid(player.session_token)
+        if sid:
+            payload = {"type": "your_cards_updated", "cards": hands.get(player.id, [])}
+            socketio.emit("your_cards_updated", payload, to=sid)
 
 
 def emit_player_removed(game_code: str, removed_session_token: str, removed_player_id: int) -> None:
@@ -89,7 +267,7 @@ def emit_player_removed(game_code: str, removed_session_token: str, removed_play
         {"type": "player_removed", "player_id": removed_player_id},
         room=game_code,
     )
-    sid = _token_to_sid.pop(removed_session_token, None)
+    sid = _sessions.pop_token(removed_session_token)
     if sid:
         # Calling socketio.disconnect(sid) from a Flask request thread can throw
         # depending on async mode / namespace state. Swallow it — the client
@@ -100,16 +278,42 @@ def emit_player_removed(game_code: str, removed_session_token: str, removed_play
             pass
 
 
+# Coalescing buffer for connection-change broadcasts, keyed by game id:
+# (room code, {player_id: latest status}). A network blip dropping several
+# players floods the handlers with changes; buffering for one short window
+# emits each player's final status once instead of a frame per flap. The
+# wire format is unchanged — clients still receive individual
+# player_connection_changed events.
+_pending_connection_events: dict[int, tuple[str, dict[int, bool]]] = {}
+_CONNECTION_DEBOUNCE_SECONDS = 0.05
+
+
 def emit_player_connection_changed(game: Game, player_id: int, is_connected: bool) -> None:
     """Broadcast a player connection status change to the game room.
 
+    Changes within the coalescing window are merged per player, so a quick
+    reconnect inside the window broadcasts only the final status.
+
     Args:
         game: The Game instance.
         player_id: The ID of the player whose status changed.
         is_connected: The new connection status.
     """
-    socketio.emit(
-        "player_connection_changed",
-        {"type": "player_connection_changed", "player_id": player_id, "is_connected": is_connected},
-        room=game.code,
-    )
+    game_id = game.id
+    pending = _pending_connection_events.get(game_id)
+    if pending is not None:
+        pending[1][player_id] = is_connected
+        return
+    _pending_connection_events[game_id] = (game.code, {player_id: is_connected})
+
+    def _flush() -> None:
+        socketio.sleep(_CONNECTION_DEBOUNCE_SECONDS)
+        code, statuses = _pending_connection_events.pop(game_id)
+        for pid, connected in statuses.items():
+            socketio.emit(
+                "player_connection_changed",
+                {"type": "player_connection_changed", "player_id": pid, "is_connected": connected},
+                room=code,
+            )
+
+    socketio.start_background_task(_flush)
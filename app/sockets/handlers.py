@@ -1,12 +1,38 @@
 """Socket.IO event handlers."""
+import re
 from flask import request
 from flask_socketio import join_room, leave_room
+from sqlalchemy.orm import joinedload, selectinload
 from ..extensions import socketio, db
 from ..models.player import Player
 from ..models.game import Game, GamePhase
 from ..models.round import Round, RoundPhase
+from ..services.state_service import bump_state_version
 from .emitters import register_socket, unregister_socket, emit_player_connection_changed, emit_game_state
 
+# Shape checks for client-supplied identifiers, compiled once. Malformed
+# input is rejected before any DB work, and a code that already matches
+# skips the defensive .upper() allocation.
+_CODE_RE = re.compile(r"[A-Z0-9]{6}")
+_TOKEN_RE = re.compile(r"[0-9a-f]{64}")
+
+
+def _normalise_game_code(raw) -> str | None:
+    """Validate a client-supplied game code, upper-casing only if needed.
+
+    Args:
+        raw: The raw game_code value from the event payload.
+
+    Returns:
+        The canonical upper-case code, or None if it isn't a valid code.
+    """
+    if not isinstance(raw, str):
+        return None
+    if _CODE_RE.fullmatch(raw):
+        return raw
+    upper = raw.upper()
+    return upper if _CODE_RE.fullmatch(upper) else None
+
 
 @socketio.on("join_game_room")
 def handle_join_game_room(data: dict) -> None:
@@ -17,25 +43,24 @@ def handle_join_game_room(data: dict) -> None:
     Args:
         data: Dict containing game_code and session_token.
     """
-    game_code = (data.get("game_code") or "").upper()
+    game_code = _normalise_game_code(data.get("game_code") or "")
     session_token = data.get("session_token") or ""
 
-    if not game_code or not session_token:
+    if game_code is None or not isinstance(session_token, str) \
+            or not _TOKEN_RE.fullmatch(session_token):
         return
 
+    # One round-trip: the joined game row doubles as the code check, so the
+    # separate SELECT by code is gone from the handshake path.
     player = db.session.execute(
-        db.select(Player).where(Player.session_token == session_token)
-    ).scalar_one_or_none()
-
-    if player is None:
-        return
-
-    game = db.session.execute(
-        db.select(Game).where(Game.code == game_code)
+        db.select(Player)
+        .options(joinedload(Player.game))
+        .where(Player.session_token == session_token)
     ).scalar_one_or_none()
 
-    if game is None or player.game_id != game.id:
+    if player is None or player.game is None or player.game.code != game_code:
         return
+    game = player.game
 
     join_room(game_code)
     register_socket(session_token, request.sid)
@@ -43,6 +68,7 @@ def handle_join_game_room(data: dict) -> None:
     if not player.is_connected:
         player.is_connected = True
         db.session.commit()
+        bump_state_version(game.id)
         emit_player_connection_changed(game, player.id, True)
 
 
@@ -53,23 +79,27 @@ def handle_leave_game_room(data: dict) -> None:
     Args:
         data: Dict containing game_code and session_token.
     """
-    game_code = (data.get("game_code") or "").upper()
+    game_code = _normalise_game_code(data.get("game_code") or "")
     session_token = data.get("session_token") or ""
 
-    if not game_code or not session_token:
+    if game_code is None or not isinstance(session_token, str) \
+            or not _TOKEN_RE.fullmatch(session_token):
         return
 
     player = db.session.execute(
-        db.select(Player).where(Player.session_token == session_token)
+        db.select(Player)
+        .options(joinedload(Player.game))
+        .where(Player.session_token == session_token)
     ).scalar_one_or_none()
 
     if player:
         leave_room(game_code)
         unregister_socket(request.sid)
+        game = player.game
         player.is_connected = False
         db.session.commit()
+        bump_state_version(player.game_id)
 
-        game = db.session.get(Game, player.game_id)
         if game:
             emit_player_connection_changed(game, player.id, False)
 
@@ -86,23 +116,35 @@ def handle_disconnect() -> None:
     if token is None:
         return
 
-    player = db.session.execute(
-        db.select(Player).where(Player.session_token == token)
-    ).scalar_one_or_none()
-
-    if player:
-        player.is_connected = False
-        db.session.commit()
-
-        game = db.session.get(Game, player.game_id)
-        if game:
-            emit_player_connection_changed(game, player.id, False)
-
-            # Re-check if the remaining connected players satisfy round progression
-            if game.phase == GamePhase.PLAYING and game.current_round_id:
-                current_round = db.session.get(Round, game.current_round_id)
-                if current_round:
-                    _check_round_progress_after_disconnect(game, current_round)
+    # One UPDATE ... RETURNING flips the flag and identifies the player,
+    # replacing the select-then-mutate pair the handler used to issue.
+    row = db.session.execute(
+        db.update(Player)
+        .where(Player.session_token == token)
+        .values(is_connected=False)
+        .returning(Player.id, Player.game_id)
+    ).first()
+    if row is None:
+        db.session.rollback()
+        return
+    db.session.commit()
+    player_id, game_id = row
+    bump_state_version(game_id)
+
+    # The round-progress re-check can end in emit_game_state, which walks
+    # game.players and reads the current round — load everything in one go
+    # instead of lazy-loading it there.
+    game = db.session.get(
+        Game,
+        game_id,
+        options=[selectinload(Game.players), joinedload(Game.current_round)],
+    )
+    if game:
+        emit_player_connection_changed(game, player_id, False)
+
+        # Re-check if the remaining connected players satisfy round progression
+        if game.phase == GamePhase.PLAYING and game.current_round is not None:
+            _check_round_progress_after_disconnect(game, game.current_round)
 
 
 def _check_round_progress_after_disconnect(game: Game, round_obj: Round) -> None:
@@ -120,9 +162,11 @@ def _check_round_progress_after_disconnect(game: Game, round_obj: Round) -> None
     if round_obj.phase == RoundPhase.SUBMITTING:
         if round_service.check_all_submitted(game, round_obj):
             round_service.begin_voting(round_obj)
+            bump_state_version(game.id)
             emit_game_state(game)
 
     elif round_obj.phase == RoundPhase.VOTING:
         if vote_service.all_voted(game, round_obj):
             vote_service.tally_round(round_obj)
+            bump_state_version(game.id)
             emit_game_state(game)
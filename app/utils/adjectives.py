@@ -1,8 +1,8 @@
 """Adjective list and random picker for round prompts."""
-import random
-from typing import List
+import secrets
+from typing import Tuple
 
-ADJECTIVES: List[str] = [
+ADJECTIVES: Tuple[str, ...] = (
     "Funny",
     "Sad",
     "Miserable",
@@ -138,13 +138,16 @@ ADJECTIVES: List[str] = [
     "Revelatory",
     "Soul-crushing",
     "Thought-provoking",
-]
+)
 
 
 def pick_adjective() -> str:
     """Return a randomly selected adjective from the list.
 
+    secrets.randbelow skips the shared Mersenne Twister state, so concurrent
+    round starts never contend on the global generator.
+
     Returns:
         A random adjective string.
     """
-    return random.choice(ADJECTIVES)
+    return ADJECTIVES[secrets.randbelow(len(ADJECTIVES))]
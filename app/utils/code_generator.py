@@ -1,18 +1,23 @@
 """Generates unique 6-character alphanumeric game codes."""
-import random
-import string
+import secrets
 
 
-_ALPHABET = string.ascii_uppercase + string.digits
+# 32 characters exactly — uppercase letters and digits minus the ambiguous
+# 0/O and 1/I. A power-of-two alphabet lets each random byte map to a
+# character with a bitmask, so there is no modulo bias.
+_ALPHABET = b"23456789ABCDEFGHJKLMNPQRSTUVWXYZ"
 
 
 def generate_game_code(length: int = 6) -> str:
     """Generate a random uppercase alphanumeric game code.
 
+    Game codes grant room access, so they come from the secrets module
+    rather than the predictable random generator.
+
     Args:
         length: Number of characters in the code. Defaults to 6.
 
     Returns:
         A random uppercase alphanumeric string.
     """
-    return "".join(random.choices(_ALPHABET, k=length))
+    return bytes(_ALPHABET[b & 0x1F] for b in secrets.token_bytes(length)).decode("ascii")
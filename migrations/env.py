@@ -97,6 +97,17 @@ def run_migrations_online():
     connectable = get_engine()
 
     with connectable.connect() as connection:
+        # The app-level connect listener turns PRAGMA foreign_keys=ON for
+        # every SQLite connection, but batch-mode migrations rebuild tables
+        # by copy-and-drop and cannot drop a table that live rows still
+        # reference. Switch enforcement off for the migration connection;
+        # application connections keep it on. Issued on the raw DBAPI
+        # connection because the pragma is a no-op inside a transaction and
+        # must not trigger SQLAlchemy's implicit begin.
+        if connection.dialect.name == 'sqlite':
+            cursor = connection.connection.cursor()
+            cursor.execute('PRAGMA foreign_keys=OFF')
+            cursor.close()
         context.configure(
             connection=connection,
             target_metadata=get_metadata(),
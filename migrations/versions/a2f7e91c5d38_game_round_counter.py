@@ -0,0 +1,34 @@
+"""game round counter
+
+Revision ID: a2f7e91c5d38
+Revises: c84d02e1f7b9
+Create Date: 2026-08-30 14:02:11.908344
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a2f7e91c5d38'
+down_revision = 'c84d02e1f7b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column('round_counter', sa.Integer(), nullable=False, server_default='0')
+        )
+    # Backfill in-flight games so the counter picks up where their rounds left off.
+    op.execute(
+        "UPDATE games SET round_counter = ("
+        "SELECT COALESCE(MAX(round_number), 0) FROM rounds "
+        "WHERE rounds.game_id = games.id)"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('games', schema=None) as batch_op:
+        batch_op.drop_column('round_counter')
@@ -0,0 +1,32 @@
+"""composite hot-path indexes
+
+Revision ID: a81f2c9d43b7
+Revises: 4d5d049c77de
+Create Date: 2026-08-30 10:14:22.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a81f2c9d43b7'
+down_revision = '4d5d049c77de'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('cards', schema=None) as batch_op:
+        batch_op.create_index('ix_cards_game_creator', ['game_id', 'creator_id'], unique=False)
+
+    with op.batch_alter_table('players', schema=None) as batch_op:
+        batch_op.create_index('ix_players_game_role_ready', ['game_id', 'role', 'is_ready'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('players', schema=None) as batch_op:
+        batch_op.drop_index('ix_players_game_role_ready')
+
+    with op.batch_alter_table('cards', schema=None) as batch_op:
+        batch_op.drop_index('ix_cards_game_creator')
@@ -0,0 +1,31 @@
+"""drop redundant round_id indexes
+
+Revision ID: b6c30f5e81da
+Revises: f3a91d07c482
+Create Date: 2026-08-30 12:48:36.287419
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6c30f5e81da'
+down_revision = 'f3a91d07c482'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The unique constraints uq_round_player_submission and uq_round_voter_vote
+    # both lead with round_id, so the single-column indexes only add write cost.
+    with op.batch_alter_table('submissions', schema=None) as batch_op:
+        batch_op.drop_index('ix_submissions_round_id')
+    with op.batch_alter_table('votes', schema=None) as batch_op:
+        batch_op.drop_index('ix_votes_round_id')
+
+
+def downgrade():
+    with op.batch_alter_table('votes', schema=None) as batch_op:
+        batch_op.create_index('ix_votes_round_id', ['round_id'], unique=False)
+    with op.batch_alter_table('submissions', schema=None) as batch_op:
+        batch_op.create_index('ix_submissions_round_id', ['round_id'], unique=False)
@@ -0,0 +1,52 @@
+"""store enums as smallint
+
+Revision ID: c5e907b1f26a
+Revises: a81f2c9d43b7
+Create Date: 2026-08-30 11:03:47.551862
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5e907b1f26a'
+down_revision = 'a81f2c9d43b7'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, members in enum declaration order — ordinals are 1-based,
+# matching app.models.types.IntEnum)
+_ENUM_COLUMNS = [
+    ('games', 'phase', ['lobby', 'card_creation', 'playing', 'finished']),
+    ('players', 'role', ['player', 'spectator']),
+    ('cards', 'card_type', ['start', 'stop', 'continue']),
+    ('rounds', 'phase', ['submitting', 'voting', 'complete']),
+]
+
+
+def upgrade():
+    for table, column, members in _ENUM_COLUMNS:
+        for ordinal, member in enumerate(members, start=1):
+            op.execute(
+                sa.text(f"UPDATE {table} SET {column} = :ordinal WHERE {column} = :member")
+                .bindparams(ordinal=str(ordinal), member=member)
+            )
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(column, type_=sa.SmallInteger(), existing_nullable=False)
+
+
+def downgrade():
+    for table, column, members in _ENUM_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(
+                column,
+                type_=sa.Enum(*members, name=f'{table[:-1]}_{column}'),
+                existing_nullable=False,
+            )
+        for ordinal, member in enumerate(members, start=1):
+            op.execute(
+                sa.text(f"UPDATE {table} SET {column} = :member WHERE {column} = :ordinal")
+                .bindparams(ordinal=str(ordinal), member=member)
+            )
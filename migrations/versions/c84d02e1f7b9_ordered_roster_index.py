@@ -0,0 +1,27 @@
+"""ordered roster index
+
+Revision ID: c84d02e1f7b9
+Revises: e91f44b2a6d0
+Create Date: 2026-08-30 13:19:28.472915
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c84d02e1f7b9'
+down_revision = 'e91f44b2a6d0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('players', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_players_game_role_order', ['game_id', 'role', 'join_order'], unique=False
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('players', schema=None) as batch_op:
+        batch_op.drop_index('ix_players_game_role_order')
@@ -0,0 +1,80 @@
+"""cascade deletes on child fks
+
+Revision ID: d7b2e48a915c
+Revises: c5e907b1f26a
+Create Date: 2026-08-30 11:42:19.108246
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7b2e48a915c'
+down_revision = 'c5e907b1f26a'
+branch_labels = None
+depends_on = None
+
+
+# The original schema has unnamed FKs; this convention gives them
+# deterministic names during the batch copy-and-move so they can be dropped.
+_NAMING = {'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'}
+
+# table -> [(constrained column, referenced table, ondelete action)]
+_FOREIGN_KEYS = {
+    'players': [('game_id', 'games', 'CASCADE')],
+    'rounds': [('game_id', 'games', 'CASCADE')],
+    'cards': [
+        ('game_id', 'games', 'CASCADE'),
+        ('creator_id', 'players', 'CASCADE'),
+        ('holder_id', 'players', 'SET NULL'),
+    ],
+    'submissions': [
+        ('round_id', 'rounds', 'CASCADE'),
+        ('player_id', 'players', 'CASCADE'),
+        ('card_id', 'cards', 'CASCADE'),
+    ],
+    'votes': [
+        ('round_id', 'rounds', 'CASCADE'),
+        ('voter_id', 'players', 'CASCADE'),
+        ('card_id', 'cards', 'CASCADE'),
+    ],
+    'games': [
+        ('creator_id', 'players', 'SET NULL'),
+        ('current_round_id', 'rounds', 'SET NULL'),
+    ],
+}
+
+
+def _fk_name(table: str, column: str, referent: str) -> str:
+    # games.current_round_id was explicitly named in the initial schema.
+    if table == 'games' and column == 'current_round_id':
+        return 'fk_game_current_round'
+    return f'fk_{table}_{column}_{referent}'
+
+
+def _rebuild(with_ondelete: bool) -> None:
+    """Recreate every FK, with or without its ondelete action.
+
+    SQLite cannot alter constraints in place, so each table is rebuilt once
+    via batch_alter_table.
+    """
+    for table, fks in _FOREIGN_KEYS.items():
+        with op.batch_alter_table(table, schema=None, naming_convention=_NAMING) as batch_op:
+            for column, referent, action in fks:
+                name = _fk_name(table, column, referent)
+                batch_op.drop_constraint(name, type_='foreignkey')
+                batch_op.create_foreign_key(
+                    name,
+                    referent,
+                    [column],
+                    ['id'],
+                    ondelete=action if with_ondelete else None,
+                )
+
+
+def upgrade():
+    _rebuild(with_ondelete=True)
+
+
+def downgrade():
+    _rebuild(with_ondelete=False)
@@ -0,0 +1,50 @@
+"""server side timestamp defaults
+
+Revision ID: e91f44b2a6d0
+Revises: b6c30f5e81da
+Create Date: 2026-08-30 12:57:51.630284
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e91f44b2a6d0'
+down_revision = 'b6c30f5e81da'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('submissions', schema=None) as batch_op:
+        batch_op.alter_column(
+            'submitted_at',
+            existing_type=sa.DateTime(),
+            server_default=sa.func.now(),
+            existing_nullable=False,
+        )
+    with op.batch_alter_table('votes', schema=None) as batch_op:
+        batch_op.alter_column(
+            'voted_at',
+            existing_type=sa.DateTime(),
+            server_default=sa.func.now(),
+            existing_nullable=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('votes', schema=None) as batch_op:
+        batch_op.alter_column(
+            'voted_at',
+            existing_type=sa.DateTime(),
+            server_default=None,
+            existing_nullable=False,
+        )
+    with op.batch_alter_table('submissions', schema=None) as batch_op:
+        batch_op.alter_column(
+            'submitted_at',
+            existing_type=sa.DateTime(),
+            server_default=None,
+            existing_nullable=False,
+        )
@@ -0,0 +1,28 @@
+"""composite card hand index
+
+Revision ID: f3a91d07c482
+Revises: d7b2e48a915c
+Create Date: 2026-08-30 12:21:05.914733
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a91d07c482'
+down_revision = 'd7b2e48a915c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('cards', schema=None) as batch_op:
+        batch_op.create_index('ix_cards_holder_is_played', ['holder_id', 'is_played'], unique=False)
+        # Redundant now — the composite index shares its leading column.
+        batch_op.drop_index('ix_cards_holder_id')
+
+
+def downgrade():
+    with op.batch_alter_table('cards', schema=None) as batch_op:
+        batch_op.create_index('ix_cards_holder_id', ['holder_id'], unique=False)
+        batch_op.drop_index('ix_cards_holder_is_played')